@@ -8,12 +8,14 @@ import os
 import sys
 from datetime import datetime, date, time
 
+from sqlalchemy import MetaData, Table, bindparam, insert, inspect, select, text, tuple_, update
+
 # Add the project root to the Python path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
-from src.server.event_service import app, db
-from src.server.models import Event, Participant
+from src.server.db import app, db
+from src.server.models import Event
 
 def init_database():
     """Initialize the database with tables."""
@@ -23,13 +25,8 @@ def init_database():
         print("Database tables created successfully!")
 
 def add_sample_data():
-    """Add sample events to the database."""
-    with app.app_context():
-        # Check if we already have data
-        if Event.query.count() > 0:
-            print("Database already has data. Skipping sample data insertion.")
-            return
-        
+    """Add sample events to the database in a single transaction."""
+    with app.app_context(), db.session.begin():
         # Sample events
         sample_events = [
             {
@@ -67,20 +64,58 @@ def add_sample_data():
             }
         ]
         
-        for event_data in sample_events:
-            # Create event
-            event = Event.from_dict(event_data)
-            db.session.add(event)
-            db.session.flush()  # Get the ID
-            
-            # Add participants
-            if 'participants' in event_data:
-                for participant_name in event_data['participants']:
-                    participant = Participant(name=participant_name, event_id=event.id)
-                    db.session.add(participant)
+        # Insert only the samples not seeded yet, found by their (title, date, time)
+        # in one query; user events may share those fields, so nothing enforces
+        # them as a key. Participants are a column on the event row
+        seed_keys = [(event_data['title'], event_data['date'], event_data['time'])
+                     for event_data in sample_events]
+        seeded = {
+            tuple(row) for row in db.session.execute(
+                select(Event.title, Event.date, Event.time)
+                .where(tuple_(Event.title, Event.date, Event.time).in_(seed_keys))
+            )
+        }
+        missing = [event_data for event_data, key in zip(sample_events, seed_keys) if key not in seeded]
+        
+        if not missing:
+            print("Sample data already present. Skipping sample data insertion.")
+            return
+        
+        db.session.execute(insert(Event), missing)
+        print(f"Added {len(missing)} sample events to the database!")
+
+def migrate_participants():
+    """Move names from the legacy participants table into the events.participants column, then drop it."""
+    with app.app_context(), db.session.begin():
+        connection = db.session.connection()
+        columns = {column['name'] for column in inspect(connection).get_columns('events')}
+        if 'participants' not in columns:
+            connection.execute(text('ALTER TABLE events ADD COLUMN participants JSON'))
+        
+        # The legacy one-row-per-participant table has no model any more; reflect it
+        names_by_event = {}
+        legacy = None
+        if inspect(connection).has_table('participants'):
+            legacy = Table('participants', MetaData(), autoload_with=connection)
+            for event_id, name in connection.execute(
+                select(legacy.c.event_id, legacy.c.name).order_by(legacy.c.id)
+            ):
+                names_by_event.setdefault(event_id, []).append(name)
+        
+        # Events without legacy rows get an empty list instead of NULL
+        db.session.execute(
+            update(Event).where(Event.participants.is_(None)).values(participants=[])
+        )
+        if names_by_event:
+            db.session.execute(
+                update(Event.__table__).where(Event.id == bindparam('event_id')),
+                [{'event_id': event_id, 'participants': names}
+                 for event_id, names in names_by_event.items()]
+            )
+        if legacy is not None:
+            legacy.drop(connection)
         
-        db.session.commit()
-        print(f"Added {len(sample_events)} sample events to the database!")
+        print(f"Migrated participants for {len(names_by_event)} events.")
 
 def reset_database():
     """Drop all tables and recreate them."""
@@ -98,11 +133,17 @@ if __name__ == '__main__':
             add_sample_data()
         elif sys.argv[1] == 'init':
             init_database()
+        elif sys.argv[1] == 'migrate':
+            migrate_participants()
         else:
-            print("Usage: python init_db.py [init|sample|reset]")
-            print("  init  - Initialize database tables")
-            print("  sample - Add sample data")
-            print("  reset - Reset database and add sample data")
+            # Joined and written in one call rather than a print per line
+            print('\n'.join([
+                "Usage: python init_db.py [init|sample|reset|migrate]",
+                "  init  - Initialize database tables",
+                "  sample - Add sample data",
+                "  reset - Reset database and add sample data",
+                "  migrate - Move legacy participants rows into events.participants"
+            ]))
     else:
         init_database()
         add_sample_data()
\ No newline at end of file
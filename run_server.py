@@ -1,7 +1,20 @@
+import os
+
+from waitress import serve
 from werkzeug.serving import run_simple
 from src.server.event_service import wsgi_app
 
+# On Linux/macOS the same app can run under gunicorn with several worker
+# processes, each with its own connection pool:
+#   gunicorn -k gthread -w 4 --threads 8 -b 127.0.0.1:8000 src.server.event_service:wsgi_app
+
 if __name__ == '__main__':
     # Run the WSGI application on localhost:8000
     print("Starting Event Scheduling SOAP Service on http://127.0.0.1:8000/soap?wsdl")
-    run_simple('127.0.0.1', 8000, wsgi_app, use_debugger=True)
\ No newline at end of file
+    if os.getenv('DEV'):
+        # Werkzeug development server, threaded so concurrent SOAP requests overlap
+        run_simple('127.0.0.1', 8000, wsgi_app, use_debugger=False, use_reloader=False,
+                   threaded=True, processes=1)
+    else:
+        # Multi-threaded production server so concurrent SOAP requests do not serialize
+        serve(wsgi_app, host='127.0.0.1', port=8000, threads=8, _quiet=True)
\ No newline at end of file
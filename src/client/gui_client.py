@@ -1,33 +1,112 @@
+import io
+import os
+import re
+import tempfile
 import tkinter as tk
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk, messagebox
-from zeep import Client
-from zeep.exceptions import Fault
 from datetime import date, time
 
+# zeep and requests (lxml, urllib3, ...) are imported lazily so the window can draw first
+
 # --- Configuration ---
 SERVICE_URL = 'http://localhost:8000/soap?wsdl'
+WSDL_CACHE_PATH = os.path.join(tempfile.gettempdir(), 'zeep-cache.db')
+WSDL_CACHE_TIMEOUT = 3600  # seconds
+PAGE_SIZE = 50  # events per GetEventsPage call
+EVENT_CACHE_TTL = 10  # seconds a GetEvent result is reused
 # ---
 
+# Cheap shape checks that reject malformed input before fromisoformat runs
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_TIME_RE = re.compile(r'^\d{2}:\d{2}:\d{2}$')
+
+# Fields shown for a single event, in display order
+_DISPLAY_FIELDS = ('id', 'title', 'agenda', 'date', 'time', 'importance', 'location', 'coordinator', 'recurrence')
+
+# Keep-alive HTTP session shared by every Zeep transport in this process
+_HTTP_SESSION = None
+
+def get_http_session():
+    """Returns the shared requests session, pooling one connection per SOAP worker."""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        _HTTP_SESSION = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0)
+        _HTTP_SESSION.mount('http://', adapter)
+        _HTTP_SESSION.mount('https://', adapter)
+    return _HTTP_SESSION
+
+def create_transport():
+    """Creates a Zeep transport backed by the on-disk WSDL cache shared across launches."""
+    from zeep.cache import SqliteCache
+    from zeep.transports import Transport
+    
+    return Transport(session=get_http_session(),
+                     cache=SqliteCache(path=WSDL_CACHE_PATH, timeout=WSDL_CACHE_TIMEOUT))
+
+def create_client():
+    """Builds the zeep Client for SERVICE_URL."""
+    from zeep import Client
+    
+    return Client(SERVICE_URL, transport=create_transport())
+
 class EventServiceClientGUI(tk.Tk):
     """GUI Client for the Event Scheduling SOAP Service."""
     
-    def __init__(self):
+    def __init__(self, client=None):
         super().__init__()
         self.title("SOAP Event Scheduling Client (CRUD Demo)")
         self.geometry("800x600")
         
-        # Initialize Zeep Client
+        # Paging state for the event list
+        self.page = 0
+        self.total_events = None
+        
+        # Recently viewed GetEvent results; only touched on the Tk thread
+        self._event_cache = TTLCache(maxsize=256, ttl=EVENT_CACHE_TTL)
+        
+        # Worker pool for SOAP calls so the Tk event loop never blocks on the network
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        
+        self.client = None
+        self._Fault = None  # zeep.exceptions.Fault, bound once zeep is loaded
+        
+        self.create_widgets()
+        
+        # Reuse the caller's client so the WSDL is parsed only once; otherwise connect
+        # after mainloop starts so the window is drawn while zeep loads
+        if client:
+            self._set_client(client)
+            self.update_status("Client Ready.")
+        else:
+            self.update_status("Connecting...")
+            self.after(0, self._connect_client)
+
+    def _connect_client(self):
+        """Initializes the Zeep Client on the worker pool."""
+        self._submit(create_client, self._render_connect)
+
+    def _render_connect(self, future):
+        """Stores the new client or reports the connection failure (Tk thread)."""
         try:
-            self.client = Client(SERVICE_URL)
-            self.event_factory = self.client.get_type('ns0:EventType')
-            self.status_message = "Client Ready."
+            self._set_client(future.result())
+            self.update_status("Client Ready.")
         except Exception as e:
-            self.client = None
-            self.status_message = f"ERROR: Failed to connect to service. Ensure server is running. {e}"
-            messagebox.showerror("Connection Error", self.status_message)
-            
-        self.create_widgets()
-        self.update_status(self.status_message)
+            status_message = f"ERROR: Failed to connect to service. Ensure server is running. {e}"
+            messagebox.showerror("Connection Error", status_message)
+            self.update_status(status_message)
+
+    def _set_client(self, client):
+        """Binds the connected client and zeep's Fault type."""
+        from zeep.exceptions import Fault
+        
+        self._Fault = Fault
+        self.client = client
 
     def create_widgets(self):
         """Sets up the main GUI structure (Tabs and Status Bar)."""
@@ -59,6 +138,16 @@ class EventServiceClientGUI(tk.Tk):
         self.status_label.config(text=message)
         print(f"STATUS: {message}")
 
+    def _submit(self, service_call, on_done, *args):
+        """Runs a SOAP call on the worker pool; on_done receives the future on the Tk thread."""
+        future = self.executor.submit(service_call, *args)
+        future.add_done_callback(lambda f: self.after(0, on_done, f))
+
+    def destroy(self):
+        """Stops the worker pool along with the window."""
+        self.executor.shutdown(wait=False)
+        super().destroy()
+
     # --- TAB 1: CREATE/UPDATE ---
     def _setup_create_update_tab(self):
         """Sets up widgets for the AddEvent and UpdateEvent operations."""
@@ -130,12 +219,17 @@ class EventServiceClientGUI(tk.Tk):
             data['participants'] = {'participant': participants_list} if participants_list else None
             
             # Validation
-            if not all([data['title'], data['date'], data['time'], data['importance'], data['location'], data['coordinator'], data['recurrence']]):
+            if (not data['title'] or not data['date'] or not data['time'] or not data['importance']
+                    or not data['location'] or not data['coordinator'] or not data['recurrence']):
                 raise ValueError("All fields marked with '*' must be filled.")
             if require_id and data['id'] == '0':
                  raise ValueError("ID is required for the Update operation.")
 
             # Basic format validation (Spyne/Zeep handle full XSD validation)
+            if not _DATE_RE.match(data['date']):
+                raise ValueError(f"Invalid date '{data['date']}', expected YYYY-MM-DD.")
+            if not _TIME_RE.match(data['time']):
+                raise ValueError(f"Invalid time '{data['time']}', expected HH:MM:SS.")
             date.fromisoformat(data['date'])
             time.fromisoformat(data['time'])
             
@@ -159,28 +253,34 @@ class EventServiceClientGUI(tk.Tk):
         if not event_data:
             return
 
-        try:
-            # Create the Zeep complex type object
-            zeep_event = self.event_factory(**event_data)
+        if operation == 'AddEvent':
+            # Remove the placeholder ID
+            event_data.pop('id') 
+
+        # Zeep serializes the plain dict against EventType, no per-call type construction
+        self.update_status(f"{operation} in progress...")
+        self._submit(getattr(self.client.service, operation),
+                     lambda f: self._render_crud_op(operation, event_data, f), event_data)
 
+    def _render_crud_op(self, operation, event_data, future):
+        """Shows the outcome of an AddEvent/UpdateEvent call (Tk thread)."""
+        try:
             if operation == 'AddEvent':
-                # Remove the placeholder ID
-                event_data.pop('id') 
-                
-                new_id = self.client.service.AddEvent(zeep_event)
+                new_id = future.result()
                 self.update_status(f"✅ {operation} Successful. New ID: {new_id}")
                 # Update the ID field in the GUI for immediate follow-up
                 self.entries['ID (for Update)'].delete(0, tk.END)
                 self.entries['ID (for Update)'].insert(0, new_id)
 
             elif operation == 'UpdateEvent':
-                success = self.client.service.UpdateEvent(zeep_event)
+                success = future.result()
                 if success:
+                    self._event_cache.pop(event_data['id'], None)
                     self.update_status(f"✅ {operation} Successful for ID: {event_data['id']}")
                 else:
                     self.update_status(f"❌ {operation} Failed. Event ID not found: {event_data['id']}")
 
-        except Fault as f:
+        except self._Fault as f:
             messagebox.showerror("SOAP Fault", f"Operation failed: {f.message}")
             self.update_status(f"❌ SOAP Fault during {operation}.")
         except Exception as e:
@@ -200,16 +300,37 @@ class EventServiceClientGUI(tk.Tk):
         self.read_id_entry.pack(side=tk.LEFT, padx=5, fill="x", expand=True)
         ttk.Button(single_frame, text="Get Event", command=self._read_single_event).pack(side=tk.LEFT, padx=5)
 
-        # --- Frame for All Events / Output ---
+        # --- Frame for All Events (GetAllEvents) ---
         output_frame = ttk.LabelFrame(self.read_tab, text="Query Results", padding="10")
         output_frame.pack(pady=10, padx=10, expand=True, fill="both")
         
+        # Treeview keeps rows natively and only draws the visible viewport
+        columns = ('id', 'title', 'date', 'time', 'recurrence', 'participants')
+        self.events_tree = ttk.Treeview(output_frame, columns=columns, show='headings', height=10)
+        for col in columns:
+            self.events_tree.heading(col, text=col.capitalize())
+            self.events_tree.column(col, width=110)
+        tree_scrollbar = ttk.Scrollbar(output_frame, orient="vertical", command=self.events_tree.yview)
+        self.events_tree.configure(yscrollcommand=tree_scrollbar.set)
+        self.events_tree.pack(side=tk.LEFT, expand=True, fill="both", padx=5, pady=5)
+        tree_scrollbar.pack(side=tk.RIGHT, fill="y")
+        
+        # --- Frame for Single Event Output ---
+        details_frame = ttk.LabelFrame(self.read_tab, text="Event Details", padding="10")
+        details_frame.pack(pady=10, padx=10, fill="x")
+        
         # Text area for output
-        self.output_text = tk.Text(output_frame, wrap=tk.WORD, height=15)
+        self.output_text = tk.Text(details_frame, wrap=tk.WORD, height=8)
         self.output_text.pack(expand=True, fill="both", padx=5, pady=5)
         
-        # Button to read all
-        ttk.Button(self.read_tab, text="Read All Events (GetAllEvents)", command=self._read_all_events).pack(pady=10)
+        # Paging controls
+        paging_frame = ttk.Frame(self.read_tab)
+        paging_frame.pack(pady=10)
+        ttk.Button(paging_frame, text="< Prev", command=lambda: self._change_page(-1)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(paging_frame, text="Read All Events (GetEventsPage)", command=self._read_all_events).pack(side=tk.LEFT, padx=5)
+        ttk.Button(paging_frame, text="Next >", command=lambda: self._change_page(1)).pack(side=tk.LEFT, padx=5)
+        self.page_label = ttk.Label(paging_frame, text="")
+        self.page_label.pack(side=tk.LEFT, padx=5)
 
     def _read_single_event(self):
         """Handles the GetEvent operation."""
@@ -221,57 +342,104 @@ class EventServiceClientGUI(tk.Tk):
             self.output_text.insert(tk.END, "Please enter an Event ID.")
             return
 
+        cached = self._event_cache.get(event_id)
+        if cached is not None:
+            self._show_single_event(event_id, cached)
+            return
+
+        self._submit(self.client.service.GetEvent, lambda f: self._render_single_event(event_id, f), event_id)
+
+    def _render_single_event(self, event_id, future):
+        """Renders the GetEvent result (Tk thread)."""
         try:
-            event = self.client.service.GetEvent(event_id)
+            event = future.result()
             if event:
-                self.output_text.insert(tk.END, "--- EVENT DETAILS ---\n")
-                # Iterate through event attributes for display
-                for attr, value in event.__dict__.items():
-                    # Format participants nicely
-                    if attr == 'participants' and value is not None and hasattr(value, 'participant'):
-                        participants = ', '.join(value.participant)
-                        self.output_text.insert(tk.END, f"{attr.capitalize()}: {participants}\n")
-                    elif attr != 'participants': # Avoid printing the object reference if not handled
-                        self.output_text.insert(tk.END, f"{attr.capitalize()}: {value}\n")
-                self.update_status(f"✅ GetEvent Successful for ID: {event_id}")
-            else:
-                self.output_text.insert(tk.END, f"Event with ID '{event_id}' not found.")
-                self.update_status(f"❌ GetEvent Failed: Event ID not found.")
+                self._event_cache[event_id] = event
+            self._show_single_event(event_id, event)
 
-        except Fault as f:
+        except self._Fault as f:
             self.output_text.insert(tk.END, f"SOAP Fault: {f.message}")
             self.update_status("❌ SOAP Fault during GetEvent.")
         except Exception as e:
             self.output_text.insert(tk.END, f"Communication Error: {e}")
             self.update_status("❌ Communication Error during GetEvent.")
 
+    def _show_single_event(self, event_id, event):
+        """Writes one event (or a not-found note) to the details area."""
+        if event:
+            buf = io.StringIO()
+            buf.write("--- EVENT DETAILS ---\n")
+            for field in _DISPLAY_FIELDS:
+                buf.write(f"{field.capitalize()}: {getattr(event, field)}\n")
+            # Format participants nicely
+            if event.participants is not None and hasattr(event.participants, 'participant'):
+                buf.write(f"Participants: {', '.join(event.participants.participant)}\n")
+            self.output_text.insert(tk.END, buf.getvalue())
+            self.update_status(f"✅ GetEvent Successful for ID: {event_id}")
+        else:
+            self.output_text.insert(tk.END, f"Event with ID '{event_id}' not found.")
+            self.update_status(f"❌ GetEvent Failed: Event ID not found.")
+
 
     def _read_all_events(self):
-        """Handles the GetAllEvents operation."""
-        self.output_text.delete(1.0, tk.END)
+        """Handles GetEventsCount plus the first GetEventsPage."""
+        if not self.client: return
+
+        self.page = 0
+        self._submit(self.client.service.GetEventsCount, self._render_events_count)
+        self._read_events_page()
+
+    def _read_events_page(self):
+        """Requests the current page of events."""
+        self._submit(self.client.service.GetEventsPage, self._render_all_events,
+                     self.page * PAGE_SIZE, PAGE_SIZE)
+
+    def _change_page(self, step):
+        """Moves to the previous/next page if it exists."""
         if not self.client: return
 
+        page = self.page + step
+        if page < 0 or (self.total_events is not None and page * PAGE_SIZE >= self.total_events):
+            return
+        self.page = page
+        self._read_events_page()
+
+    def _page_count(self):
+        """Number of pages for the last known event count."""
+        return max((self.total_events + PAGE_SIZE - 1) // PAGE_SIZE, 1)
+
+    def _render_events_count(self, future):
+        """Stores the GetEventsCount result (Tk thread)."""
+        try:
+            self.total_events = future.result()
+            self.page_label.config(text=f"Page {self.page + 1} of {self._page_count()}")
+        except Exception as e:
+            self.total_events = None
+            self.update_status(f"❌ GetEventsCount failed: {e}")
+
+    def _render_all_events(self, future):
+        """Renders the GetEventsPage result (Tk thread)."""
         try:
-            events = self.client.service.GetAllEvents()
-            self.output_text.insert(tk.END, f"--- ALL EVENTS ({len(events)} Total) ---\n")
+            events = future.result()
+            self.events_tree.delete(*self.events_tree.get_children())
             
-            for i, event in enumerate(events, 1):
-                self.output_text.insert(tk.END, f"\n[{i}] ID: {event.id}\n")
-                self.output_text.insert(tk.END, f"    Title: {event.title}\n")
-                self.output_text.insert(tk.END, f"    Date/Time: {event.date} @ {event.time}\n")
-                self.output_text.insert(tk.END, f"    Recurrence: {event.recurrence}\n")
+            for event in events:
+                participants = ''
                 if event.participants and hasattr(event.participants, 'participant'):
                     participants = ', '.join(event.participants.participant)
-                    self.output_text.insert(tk.END, f"    Participants: {participants}\n")
+                self.events_tree.insert('', tk.END, values=(event.id, event.title, event.date, event.time,
+                                                            event.recurrence, participants))
             
-            self.update_status(f"✅ GetAllEvents Successful. Total: {len(events)}")
+            if self.total_events is not None:
+                self.page_label.config(text=f"Page {self.page + 1} of {self._page_count()}")
+            self.update_status(f"✅ GetEventsPage Successful. Page {self.page + 1}: {len(events)} events")
 
-        except Fault as f:
-            self.output_text.insert(tk.END, f"SOAP Fault: {f.message}")
-            self.update_status("❌ SOAP Fault during GetAllEvents.")
+        except self._Fault as f:
+            messagebox.showerror("SOAP Fault", f"Operation failed: {f.message}")
+            self.update_status("❌ SOAP Fault during GetEventsPage.")
         except Exception as e:
-            self.output_text.insert(tk.END, f"Communication Error: {e}")
-            self.update_status("❌ Communication Error during GetAllEvents.")
+            messagebox.showerror("Communication Error", str(e))
+            self.update_status("❌ Communication Error during GetEventsPage.")
 
     # --- TAB 3: DELETE ---
     def _setup_delete_tab(self):
@@ -298,9 +466,14 @@ class EventServiceClientGUI(tk.Tk):
         if not messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete event ID: {event_id}?"):
             return
 
+        self._submit(self.client.service.DeleteEvent, lambda f: self._render_delete_event(event_id, f), event_id)
+
+    def _render_delete_event(self, event_id, future):
+        """Shows the outcome of a DeleteEvent call (Tk thread)."""
         try:
-            success = self.client.service.DeleteEvent(event_id)
+            success = future.result()
             if success:
+                self._event_cache.pop(event_id, None)
                 messagebox.showinfo("Success", f"Event ID {event_id} deleted successfully.")
                 self.update_status(f"✅ DeleteEvent Successful for ID: {event_id}")
                 self.delete_id_entry.delete(0, tk.END)
@@ -308,7 +481,7 @@ class EventServiceClientGUI(tk.Tk):
                 messagebox.showerror("Failure", f"Event ID {event_id} not found or deletion failed.")
                 self.update_status(f"❌ DeleteEvent Failed: ID not found.")
                 
-        except Fault as f:
+        except self._Fault as f:
             messagebox.showerror("SOAP Fault", f"Operation failed: {f.message}")
             self.update_status("❌ SOAP Fault during DeleteEvent.")
         except Exception as e:
@@ -319,13 +492,14 @@ class EventServiceClientGUI(tk.Tk):
 if __name__ == '__main__':
     # Add a mandatory check before running the GUI
     try:
-        # We need to explicitly handle date/time objects for default data
-        _ = Client(SERVICE_URL)
+        # The client connects in the background once the window is up
         app = EventServiceClientGUI()
         app.mainloop()
     except Exception as e:
-        print("\n" + "="*50)
-        print("!!! ERROR STARTING GUI CLIENT !!!")
-        print("Please ensure the SOAP Server (run_server.py) is running on http://localhost:8000/soap")
-        print(f"Original Error: {e}")
-        print("="*50)
\ No newline at end of file
+        print('\n'.join([
+            "\n" + "="*50,
+            "!!! ERROR STARTING GUI CLIENT !!!",
+            "Please ensure the SOAP Server (run_server.py) is running on http://localhost:8000/soap",
+            f"Original Error: {e}",
+            "="*50
+        ]))
\ No newline at end of file
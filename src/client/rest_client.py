@@ -1,8 +1,46 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import requests
-import json
-from datetime import date, datetime
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+
+# Request bodies are pre-encoded with orjson, so the content type is set explicitly
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Delta refreshes ask for changes from this long before the newest updated_at seen:
+# updated_at is set when a write starts, so a write that commits after a refresh can
+# carry an earlier timestamp. Events fetched again are merged by ID.
+_REFRESH_OVERLAP = timedelta(seconds=60)
+
+# Form label -> event field key, shared by the create and update forms
+_FIELD_KEY = {
+    'Title *': 'title',
+    'Agenda': 'agenda',
+    'Date (YYYY-MM-DD) *': 'date',
+    'Time (HH:MM:SS) *': 'time',
+    'Location': 'location',
+    'Coordinator *': 'coordinator',
+    'Participants (comma-separated)': 'participants',
+}
+
+# Details pane layout; fields missing from the event render as N/A
+_DETAILS_TMPL = """Event Details:
+ID: {id}
+Title: {title}
+Agenda: {agenda}
+Date: {date}
+Time: {time}
+Importance: {importance}
+Location: {location}
+Coordinator: {coordinator}
+Recurrence: {recurrence}
+Participants: {participants}
+Created: {created_at}
+Updated: {updated_at}"""
 
 class RestEventClientGUI(tk.Tk):
     """REST API Client for the Event Scheduling System."""
@@ -15,21 +53,48 @@ class RestEventClientGUI(tk.Tk):
         # Configuration
         self.base_url = 'http://localhost:8000/api'
         
-        # Test connection
-        self.test_connection()
-        
+        # One pooled session so calls reuse keep-alive connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'Accept': 'application/json'})
+        
+        # HTTP calls run here so the Tk event loop never blocks on the network
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        
+        # Last event list (keyed by ID) and its ETag, for conditional refreshes
+        # and for showing details without another request
+        self._events_etag = None
+        self._events_by_id = {}
+        self._last_refresh_ts = None  # newest updated_at seen; delta refreshes start _REFRESH_OVERLAP before it
+        self._refresh_after_id = None  # pending debounced refresh
+        self._last_details_text = None
+        
+        # Show the window right away and test the connection in the background
+        self.connection_status = "Connecting..."
         self.create_widgets()
+        self.test_connection()
     
     def test_connection(self):
         """Test connection to the server."""
+        self._submit(self.session.get, self._on_health_done, f'{self.base_url}/health', timeout=5)
+    
+    def _on_health_done(self, future):
+        """Report the health check result in the status bar (Tk thread)."""
         try:
-            response = requests.get(f'{self.base_url}/health', timeout=5)
+            response = future.result()
             if response.status_code == 200:
                 self.connection_status = "✅ Connected to server"
             else:
                 self.connection_status = f"⚠️ Server responded with status {response.status_code}"
         except requests.exceptions.RequestException as e:
             self.connection_status = f"❌ Cannot connect to server: {str(e)}"
+        self.update_status(self.connection_status)
     
     def create_widgets(self):
         """Create the main GUI widgets."""
@@ -91,7 +156,8 @@ class RestEventClientGUI(tk.Tk):
         button_frame = ttk.Frame(frame)
         button_frame.pack(fill="x", padx=10, pady=10)
         
-        ttk.Button(button_frame, text="Create Event", command=self.create_event).pack(side=tk.LEFT, padx=5)
+        self.create_button = ttk.Button(button_frame, text="Create Event", command=self.create_event)
+        self.create_button.pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Clear Form", command=self.clear_create_form).pack(side=tk.LEFT, padx=5)
     
     def view_events_tab(self):
@@ -103,8 +169,10 @@ class RestEventClientGUI(tk.Tk):
         control_frame = ttk.Frame(frame)
         control_frame.pack(fill="x", padx=10, pady=10)
         
-        ttk.Button(control_frame, text="Refresh Events", command=self.refresh_events).pack(side=tk.LEFT, padx=5)
-        ttk.Button(control_frame, text="Get Event by ID", command=self.get_event_by_id).pack(side=tk.LEFT, padx=5)
+        self.refresh_button = ttk.Button(control_frame, text="Refresh Events", command=self.refresh_events)
+        self.refresh_button.pack(side=tk.LEFT, padx=5)
+        self.get_button = ttk.Button(control_frame, text="Get Event by ID", command=self.get_event_by_id)
+        self.get_button.pack(side=tk.LEFT, padx=5)
         
         self.event_id_entry = ttk.Entry(control_frame, width=20)
         self.event_id_entry.pack(side=tk.LEFT, padx=5)
@@ -160,7 +228,8 @@ class RestEventClientGUI(tk.Tk):
         ttk.Label(id_frame, text="Event ID:").pack(side=tk.LEFT, padx=5)
         self.update_id_entry = ttk.Entry(id_frame, width=40)
         self.update_id_entry.pack(side=tk.LEFT, padx=5, fill="x", expand=True)
-        ttk.Button(id_frame, text="Load Event", command=self.load_event_for_update).pack(side=tk.LEFT, padx=5)
+        self.load_button = ttk.Button(id_frame, text="Load Event", command=self.load_event_for_update)
+        self.load_button.pack(side=tk.LEFT, padx=5)
         
         # Update form
         update_frame = ttk.LabelFrame(frame, text="Update Event", padding="10")
@@ -177,9 +246,10 @@ class RestEventClientGUI(tk.Tk):
             ('Participants (comma-separated)', '')
         ]
         
+        self.update_vars = {label_text: tk.StringVar() for label_text, _ in fields}
         for i, (label_text, default_value) in enumerate(fields):
             ttk.Label(update_frame, text=label_text).grid(row=i, column=0, sticky='w', pady=5, padx=5)
-            entry = ttk.Entry(update_frame, width=50)
+            entry = ttk.Entry(update_frame, width=50, textvariable=self.update_vars[label_text])
             entry.grid(row=i, column=1, sticky='ew', pady=5, padx=5)
             self.update_entries[label_text] = entry
         
@@ -200,8 +270,10 @@ class RestEventClientGUI(tk.Tk):
         button_frame = ttk.Frame(frame)
         button_frame.pack(fill="x", padx=10, pady=10)
         
-        ttk.Button(button_frame, text="Update Event", command=self.update_event).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Delete Event", command=self.delete_event).pack(side=tk.LEFT, padx=5)
+        self.update_button = ttk.Button(button_frame, text="Update Event", command=self.update_event)
+        self.update_button.pack(side=tk.LEFT, padx=5)
+        self.delete_button = ttk.Button(button_frame, text="Delete Event", command=self.delete_event)
+        self.delete_button.pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Clear Form", command=self.clear_update_form).pack(side=tk.LEFT, padx=5)
     
     def create_event(self):
@@ -212,7 +284,7 @@ class RestEventClientGUI(tk.Tk):
             for label, entry in self.create_entries.items():
                 value = entry.get().strip()
                 if value:
-                    key = label.replace(' *', '').replace(' (YYYY-MM-DD)', '').replace(' (HH:MM:SS)', '').replace(' (comma-separated)', '').lower()
+                    key = _FIELD_KEY[label]
                     event_data[key] = value
             
             event_data['importance'] = self.importance_var.get()
@@ -231,16 +303,26 @@ class RestEventClientGUI(tk.Tk):
                 return
             
             # Send request
-            response = requests.post(f'{self.base_url}/events', json=event_data, timeout=10)
+            self._submit(self.session.post, self._on_create_done, f'{self.base_url}/events',
+                         button=self.create_button, data=orjson.dumps(event_data),
+                         headers=_JSON_HEADERS, timeout=10)
+        
+        except Exception as e:
+            messagebox.showerror("Error", f"Unexpected error: {str(e)}")
+            self.update_status("❌ Unexpected error")
+    
+    def _on_create_done(self, future):
+        """Handle the create response (Tk thread)."""
+        try:
+            response = future.result()
             
             if response.status_code == 201:
-                result = response.json()
+                result = orjson.loads(response.content)
                 messagebox.showinfo("Success", f"Event created successfully! ID: {result['event_id']}")
                 self.update_status("✅ Event created successfully")
-                self.refresh_events()
+                self._schedule_refresh()
             else:
-                error_data = response.json()
-                messagebox.showerror("Error", f"Failed to create event: {error_data.get('error', 'Unknown error')}")
+                messagebox.showerror("Error", f"Failed to create event: {self._error_msg(response)}")
                 self.update_status("❌ Failed to create event")
         
         except requests.exceptions.RequestException as e:
@@ -252,34 +334,80 @@ class RestEventClientGUI(tk.Tk):
     
     def refresh_events(self):
         """Refresh the events list."""
+        headers = {'If-None-Match': self._events_etag} if self._events_etag else {}
+        # The tree only needs the summary columns; details are fetched on selection
+        params = {'fields': 'summary'}
+        if self._last_refresh_ts:
+            since = datetime.fromisoformat(self._last_refresh_ts) - _REFRESH_OVERLAP
+            params['updated_since'] = since.isoformat()
+        self._submit(self.session.get, self._on_refresh_done, f'{self.base_url}/events',
+                     button=self.refresh_button, headers=headers, params=params, timeout=10)
+    
+    def _schedule_refresh(self):
+        """Coalesce refreshes requested within 200 ms (e.g. after several quick edits) into one."""
+        if self._refresh_after_id:
+            self.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.after(200, self._do_refresh)
+    
+    def _do_refresh(self):
+        """Run the debounced refresh."""
+        self._refresh_after_id = None
+        self.refresh_events()
+    
+    def _full_refresh(self):
+        """Drop the delta state and reload the whole list."""
+        self._events_etag = None
+        self._last_refresh_ts = None
+        self.refresh_events()
+    
+    def _on_refresh_done(self, future):
+        """Fill the events tree from the list response (Tk thread)."""
         try:
-            response = requests.get(f'{self.base_url}/events', timeout=10)
+            response = future.result()
+            
+            if response.status_code == 304:
+                # Unchanged on the server; keep the current tree as is
+                self.update_status(f"✅ Loaded {len(self._events_by_id)} events")
+                return
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 events = data.get('events', [])
+                delta = self._last_refresh_ts is not None
                 
-                # Clear existing items
-                for item in self.events_tree.get_children():
-                    self.events_tree.delete(item)
+                if delta:
+                    # Merge changed events; the total reveals deletions made elsewhere
+                    self._events_by_id.update((event['id'], event) for event in events)
+                    if len(self._events_by_id) != data.get('total', len(self._events_by_id)):
+                        self._full_refresh()
+                        return
+                else:
+                    self._events_by_id = {event['id']: event for event in events}
                 
-                # Add events to tree
-                for event in events:
-                    values = (
-                        event.get('id', '')[:8] + '...' if len(event.get('id', '')) > 8 else event.get('id', ''),
-                        event.get('title', ''),
-                        event.get('date', ''),
-                        event.get('time', ''),
-                        event.get('importance', ''),
-                        event.get('location', ''),
-                        event.get('coordinator', '')
-                    )
-                    self.events_tree.insert('', 'end', values=values, tags=(event.get('id'),))
+                self._events_etag = response.headers.get('ETag')
+                timestamps = [event['updated_at'] for event in events if event.get('updated_at')]
+                if timestamps:
+                    self._last_refresh_ts = max(timestamps + [self._last_refresh_ts or ''])
                 
-                self.update_status(f"✅ Loaded {len(events)} events")
+                # Build all rows before touching the widget
+                rows = [(self._event_row(event), event['id']) for event in events]
+                
+                if delta:
+                    # Update changed rows in place and append new ones
+                    for values, event_id in rows:
+                        if self.events_tree.exists(event_id):
+                            self.events_tree.item(event_id, values=values)
+                        else:
+                            self.events_tree.insert('', 'end', iid=event_id, values=values, tags=(event_id,))
+                else:
+                    # Clear existing items in one call, then add events to tree
+                    self.events_tree.delete(*self.events_tree.get_children())
+                    for values, event_id in rows:
+                        self.events_tree.insert('', 'end', iid=event_id, values=values, tags=(event_id,))
+                
+                self.update_status(f"✅ Loaded {len(self._events_by_id)} events")
             else:
-                error_data = response.json()
-                messagebox.showerror("Error", f"Failed to load events: {error_data.get('error', 'Unknown error')}")
+                messagebox.showerror("Error", f"Failed to load events: {self._error_msg(response)}")
                 self.update_status("❌ Failed to load events")
         
         except requests.exceptions.RequestException as e:
@@ -289,6 +417,19 @@ class RestEventClientGUI(tk.Tk):
             messagebox.showerror("Error", f"Unexpected error: {str(e)}")
             self.update_status("❌ Unexpected error")
     
+    def _event_row(self, event):
+        """Treeview values for one event."""
+        event_id = event.get('id', '')
+        return (
+            event_id[:8] + '...' if len(event_id) > 8 else event_id,
+            event.get('title', ''),
+            event.get('date', ''),
+            event.get('time', ''),
+            event.get('importance', ''),
+            event.get('location', ''),
+            event.get('coordinator', '')
+        )
+    
     def get_event_by_id(self):
         """Get a specific event by ID."""
         event_id = self.event_id_entry.get().strip()
@@ -296,11 +437,16 @@ class RestEventClientGUI(tk.Tk):
             messagebox.showerror("Error", "Please enter an Event ID")
             return
         
+        self._submit(self.session.get, lambda f: self._on_get_event_done(event_id, f),
+                     f'{self.base_url}/events/{event_id}', button=self.get_button, timeout=10)
+    
+    def _on_get_event_done(self, event_id, future):
+        """Show the event fetched by ID (Tk thread)."""
         try:
-            response = requests.get(f'{self.base_url}/events/{event_id}', timeout=10)
+            response = future.result()
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 event = data.get('event')
                 if event:
                     self.display_event_details(event)
@@ -309,8 +455,7 @@ class RestEventClientGUI(tk.Tk):
                 messagebox.showerror("Error", "Event not found")
                 self.update_status("❌ Event not found")
             else:
-                error_data = response.json()
-                messagebox.showerror("Error", f"Failed to load event: {error_data.get('error', 'Unknown error')}")
+                messagebox.showerror("Error", f"Failed to load event: {self._error_msg(response)}")
                 self.update_status("❌ Failed to load event")
         
         except requests.exceptions.RequestException as e:
@@ -328,17 +473,27 @@ class RestEventClientGUI(tk.Tk):
             tags = self.events_tree.item(item, 'tags')
             if tags:
                 event_id = tags[0]
-                self.get_event_details(event_id)
+                # List rows are summaries; fetch the full event once, then reuse it
+                event = self._events_by_id.get(event_id)
+                if event and 'participants' in event:
+                    self.display_event_details(event)
+                else:
+                    self.get_event_details(event_id)
     
     def get_event_details(self, event_id):
         """Get and display event details."""
+        self._submit(self.session.get, self._on_event_details_done, f'{self.base_url}/events/{event_id}', timeout=10)
+    
+    def _on_event_details_done(self, future):
+        """Show details for the selected event (Tk thread)."""
         try:
-            response = requests.get(f'{self.base_url}/events/{event_id}', timeout=10)
+            response = future.result()
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 event = data.get('event')
                 if event:
+                    self._events_by_id[event['id']] = event
                     self.display_event_details(event)
         
         except Exception as e:
@@ -346,22 +501,16 @@ class RestEventClientGUI(tk.Tk):
     
     def display_event_details(self, event):
         """Display event details in the text widget."""
-        self.details_text.delete('1.0', tk.END)
+        details = _DETAILS_TMPL.format_map(
+            defaultdict(lambda: 'N/A', event, participants=', '.join(event.get('participants', [])))
+        )
         
-        details = f"""Event Details:
-ID: {event.get('id', 'N/A')}
-Title: {event.get('title', 'N/A')}
-Agenda: {event.get('agenda', 'N/A')}
-Date: {event.get('date', 'N/A')}
-Time: {event.get('time', 'N/A')}
-Importance: {event.get('importance', 'N/A')}
-Location: {event.get('location', 'N/A')}
-Coordinator: {event.get('coordinator', 'N/A')}
-Recurrence: {event.get('recurrence', 'N/A')}
-Participants: {', '.join(event.get('participants', []))}
-Created: {event.get('created_at', 'N/A')}
-Updated: {event.get('updated_at', 'N/A')}"""
+        # Skip the widget update when the same event is shown again
+        if details == self._last_details_text:
+            return
+        self._last_details_text = details
         
+        self.details_text.delete('1.0', tk.END)
         self.details_text.insert('1.0', details)
     
     def load_event_for_update(self):
@@ -371,34 +520,24 @@ Updated: {event.get('updated_at', 'N/A')}"""
             messagebox.showerror("Error", "Please enter an Event ID")
             return
         
+        self._submit(self.session.get, lambda f: self._on_load_for_update_done(event_id, f),
+                     f'{self.base_url}/events/{event_id}', button=self.load_button, timeout=10)
+    
+    def _on_load_for_update_done(self, event_id, future):
+        """Populate the update form from the fetched event (Tk thread)."""
         try:
-            response = requests.get(f'{self.base_url}/events/{event_id}', timeout=10)
+            response = future.result()
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 event = data.get('event')
                 if event:
                     # Populate update form
-                    self.update_entries['Title *'].delete(0, tk.END)
-                    self.update_entries['Title *'].insert(0, event.get('title', ''))
-                    
-                    self.update_entries['Agenda'].delete(0, tk.END)
-                    self.update_entries['Agenda'].insert(0, event.get('agenda', ''))
-                    
-                    self.update_entries['Date (YYYY-MM-DD) *'].delete(0, tk.END)
-                    self.update_entries['Date (YYYY-MM-DD) *'].insert(0, event.get('date', ''))
-                    
-                    self.update_entries['Time (HH:MM:SS) *'].delete(0, tk.END)
-                    self.update_entries['Time (HH:MM:SS) *'].insert(0, event.get('time', ''))
-                    
-                    self.update_entries['Location'].delete(0, tk.END)
-                    self.update_entries['Location'].insert(0, event.get('location', ''))
-                    
-                    self.update_entries['Coordinator *'].delete(0, tk.END)
-                    self.update_entries['Coordinator *'].insert(0, event.get('coordinator', ''))
-                    
-                    self.update_entries['Participants (comma-separated)'].delete(0, tk.END)
-                    self.update_entries['Participants (comma-separated)'].insert(0, ', '.join(event.get('participants', [])))
+                    for label, key in _FIELD_KEY.items():
+                        value = event.get(key) or ''
+                        if key == 'participants':
+                            value = ', '.join(value)
+                        self.update_vars[label].set(value)
                     
                     self.update_importance_var.set(event.get('importance', 'medium'))
                     self.update_recurrence_var.set(event.get('recurrence', 'none'))
@@ -408,8 +547,7 @@ Updated: {event.get('updated_at', 'N/A')}"""
                 messagebox.showerror("Error", "Event not found")
                 self.update_status("❌ Event not found")
             else:
-                error_data = response.json()
-                messagebox.showerror("Error", f"Failed to load event: {error_data.get('error', 'Unknown error')}")
+                messagebox.showerror("Error", f"Failed to load event: {self._error_msg(response)}")
                 self.update_status("❌ Failed to load event")
         
         except requests.exceptions.RequestException as e:
@@ -432,7 +570,7 @@ Updated: {event.get('updated_at', 'N/A')}"""
             for label, entry in self.update_entries.items():
                 value = entry.get().strip()
                 if value:
-                    key = label.replace(' *', '').replace(' (YYYY-MM-DD)', '').replace(' (HH:MM:SS)', '').replace(' (comma-separated)', '').lower()
+                    key = _FIELD_KEY[label]
                     event_data[key] = value
             
             event_data['importance'] = self.update_importance_var.get()
@@ -444,18 +582,28 @@ Updated: {event.get('updated_at', 'N/A')}"""
                 event_data['participants'] = participants
             
             # Send request
-            response = requests.put(f'{self.base_url}/events/{event_id}', json=event_data, timeout=10)
+            self._submit(self.session.put, self._on_update_done, f'{self.base_url}/events/{event_id}',
+                         button=self.update_button, data=orjson.dumps(event_data),
+                         headers=_JSON_HEADERS, timeout=10)
+        
+        except Exception as e:
+            messagebox.showerror("Error", f"Unexpected error: {str(e)}")
+            self.update_status("❌ Unexpected error")
+    
+    def _on_update_done(self, future):
+        """Handle the update response (Tk thread)."""
+        try:
+            response = future.result()
             
             if response.status_code == 200:
                 messagebox.showinfo("Success", "Event updated successfully!")
                 self.update_status("✅ Event updated successfully")
-                self.refresh_events()
+                self._schedule_refresh()
             elif response.status_code == 404:
                 messagebox.showerror("Error", "Event not found")
                 self.update_status("❌ Event not found")
             else:
-                error_data = response.json()
-                messagebox.showerror("Error", f"Failed to update event: {error_data.get('error', 'Unknown error')}")
+                messagebox.showerror("Error", f"Failed to update event: {self._error_msg(response)}")
                 self.update_status("❌ Failed to update event")
         
         except requests.exceptions.RequestException as e:
@@ -476,20 +624,28 @@ Updated: {event.get('updated_at', 'N/A')}"""
         if not messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete event {event_id}?"):
             return
         
+        self._submit(self.session.delete, lambda f: self._on_delete_done(event_id, f),
+                     f'{self.base_url}/events/{event_id}', button=self.delete_button, timeout=10)
+    
+    def _on_delete_done(self, event_id, future):
+        """Handle the delete response (Tk thread)."""
         try:
-            response = requests.delete(f'{self.base_url}/events/{event_id}', timeout=10)
+            response = future.result()
             
             if response.status_code == 200:
+                # Deletions never show up in a delta refresh, so drop the row here
+                self._events_by_id.pop(event_id, None)
+                if self.events_tree.exists(event_id):
+                    self.events_tree.delete(event_id)
                 messagebox.showinfo("Success", "Event deleted successfully!")
                 self.update_status("✅ Event deleted successfully")
                 self.clear_update_form()
-                self.refresh_events()
+                self._schedule_refresh()
             elif response.status_code == 404:
                 messagebox.showerror("Error", "Event not found")
                 self.update_status("❌ Event not found")
             else:
-                error_data = response.json()
-                messagebox.showerror("Error", f"Failed to delete event: {error_data.get('error', 'Unknown error')}")
+                messagebox.showerror("Error", f"Failed to delete event: {self._error_msg(response)}")
                 self.update_status("❌ Failed to delete event")
         
         except requests.exceptions.RequestException as e:
@@ -514,6 +670,33 @@ Updated: {event.get('updated_at', 'N/A')}"""
         self.update_importance_var.set('medium')
         self.update_recurrence_var.set('none')
     
+    def _error_msg(self, response):
+        """Extract the server's error message, tolerating non-JSON error bodies."""
+        try:
+            return orjson.loads(response.content).get('error', 'Unknown error')
+        except ValueError:
+            return response.text[:200] or f'HTTP {response.status_code}'
+    
+    def _submit(self, request, on_done, *args, button=None, **kwargs):
+        """Run an HTTP call on the worker pool; on_done receives the future on the Tk thread."""
+        if button is not None:
+            # Prevent re-entry while the request is pending
+            button.state(['disabled'])
+        
+        def done(future):
+            if button is not None:
+                button.state(['!disabled'])
+            on_done(future)
+        
+        future = self.executor.submit(request, *args, **kwargs)
+        future.add_done_callback(lambda f: self.after(0, done, f))
+    
+    def destroy(self):
+        """Stop the worker pool and close pooled connections when the window closes."""
+        self.executor.shutdown(wait=False)
+        self.session.close()
+        super().destroy()
+    
     def update_status(self, message):
         """Update the status bar."""
         self.status_label.config(text=message)
@@ -1,39 +1,191 @@
-from .models import db, Event, Participant
+from .models import db, Event
+from .ids import new_id
 from datetime import datetime, date, time
+from io import StringIO
+import csv
+import json
+from sqlalchemy import bindparam, delete, func, select, update
+from sqlalchemy.orm.util import identity_key
+
+# Statements built once at import; each call only binds parameters
+_STMT_GET = select(Event).where(Event.id == bindparam('id'))
+_STMT_TITLE = select(Event.title).where(Event.id == bindparam('id'))
+_STMT_EXISTS = select(select(Event.id).where(Event.id == bindparam('id')).exists())
+_STMT_COUNT = select(func.count(Event.id))
+_STMT_VERSION = select(func.count(Event.id), func.max(Event.updated_at))
+_STMT_DATE_RANGE = select(Event).where(
+    Event.date >= bindparam('start_date'),
+    Event.date <= bindparam('end_date')
+)
+_STMT_BY_COORDINATOR = select(Event).where(
+    Event.coordinator.ilike(bindparam('pattern'))
+)
+_STMT_SEARCH = select(Event).where(
+    db.or_(
+        Event.title.ilike(bindparam('pattern')),
+        Event.agenda.ilike(bindparam('pattern')),
+        Event.location.ilike(bindparam('pattern'))
+    )
+)
+
+# Write statements, also built once; the update's SET list comes from the
+# parameter keys, so one statement serves every combination of fields
+_INSERT_EVENT = Event.__table__.insert()
+_UPDATE_EVENT_BY_ID = update(Event.__table__).where(Event.__table__.c.id == bindparam('event_id'))
+_DELETE_EVENT_BY_ID = delete(Event.__table__).where(Event.__table__.c.id == bindparam('event_id'))
+# Single-row writes hand back the stored row, so callers need no follow-up SELECT
+_INSERT_EVENT_RETURNING = _INSERT_EVENT.returning(*Event.__table__.c)
+_UPDATE_EVENT_RETURNING = _UPDATE_EVENT_BY_ID.returning(*Event.__table__.c)
+
+# Columns copied from the request data into a new row; the ID is assigned
+# by _event_row and the timestamps come from column defaults
+_INSERT_COLUMNS = ('title', 'agenda', 'date', 'time', 'importance', 'location',
+                   'coordinator', 'recurrence', 'participants')
+
+def _event_row(event_data):
+    """Parameters for _INSERT_EVENT, parsed the same way as Event.from_dict."""
+    event = Event.from_dict(event_data)
+    row = {column: getattr(event, column) for column in _INSERT_COLUMNS}
+    row['id'] = new_id()
+    return row
+
+def _csv_events(csv_file):
+    """Yield the events of an events CSV as dicts; an empty field counts as not given."""
+    for row in csv.DictReader(csv_file):
+        event_data = {column: value for column, value in row.items() if value != ''}
+        event_data['participants'] = json.loads(event_data.get('participants', '[]'))
+        yield event_data
+
+# PostgreSQL bulk load: the insert columns plus the ID and timestamps the ORM defaults fill in
+_COPY_EVENTS_SQL = (
+    'COPY events (id, created_at, updated_at, ' + ', '.join(_INSERT_COLUMNS) + ') '
+    'FROM STDIN WITH (FORMAT csv)'
+)
+
+def _copy_events(session, events_data):
+    """Send events through COPY on the session's connection; returns the row count.
+    
+    Rows are built by _event_row and get the timestamps the column defaults
+    would set, so COPY stores the same values as add_events_bulk. None is
+    written as an unquoted empty field, which COPY reads as NULL.
+    """
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    count = 0
+    for event_data in events_data:
+        row = _event_row(event_data)
+        row['participants'] = json.dumps(row['participants'])
+        now = datetime.utcnow()
+        writer.writerow([row['id'], now, now] + [row[column] for column in _INSERT_COLUMNS])
+        count += 1
+    buffer.seek(0)
+    # Raw psycopg2 cursor on the connection the session's transaction is using
+    cursor = session.connection().connection.dbapi_connection.cursor()
+    try:
+        cursor.copy_expert(_COPY_EVENTS_SQL, buffer)
+    finally:
+        cursor.close()
+    return count
+
+def _forget_loaded(session, event_id, deleted=False):
+    """Bring an Event the session already holds in line with a Core write to its row.
+    
+    Core UPDATE/DELETE bypass the identity map, so without this later ORM
+    queries in the same session would hand back the old attribute values.
+    """
+    event = session.identity_map.get(identity_key(Event, event_id))
+    if event is None:
+        return
+    if deleted:
+        session.expunge(event)
+    else:
+        session.expire(event)
+
+def _complete(session, owns_transaction):
+    """Commit a transaction this service opened, or only flush into the caller's."""
+    if owns_transaction:
+        session.commit()
+    else:
+        session.flush()
+
+def _abort(session, owns_transaction):
+    """Roll back a transaction this service opened; a caller's transaction is theirs to undo."""
+    if owns_transaction:
+        session.rollback()
 
 class EventService:
-    """Database service for event operations."""
+    """Database service for event operations.
+    
+    Write methods commit on the Flask-SQLAlchemy session by default. Passing
+    `session` runs them inside the caller's transaction instead: they only
+    flush, and committing or rolling back is left to the caller.
+    """
     
     @staticmethod
-    def add_event(event_data):
-        """Add a new event to the database."""
+    def add_event(event_data, session=None):
+        """Add a new event to the database; returns the stored event as a dict."""
+        owns_transaction = session is None
+        session = db.session if owns_transaction else session
         try:
-            # Create event from dictionary
-            event = Event.from_dict(event_data)
+            # Participants ride along on the same row
+            event = dict(session.execute(_INSERT_EVENT_RETURNING, _event_row(event_data)).mappings().one())
             
-            # Add event to database
-            db.session.add(event)
-            db.session.flush()  # Get the ID without committing
+            _complete(session, owns_transaction)
+            return event
             
-            # Add participants if provided
-            if 'participants' in event_data and event_data['participants']:
-                for participant_name in event_data['participants']:
-                    if participant_name:  # Skip empty names
-                        participant = Participant(name=participant_name, event_id=event.id)
-                        db.session.add(participant)
+        except Exception as e:
+            _abort(session, owns_transaction)
+            raise Exception(f"Failed to add event: {str(e)}")
+    
+    @staticmethod
+    def add_events_bulk(events_data, session=None):
+        """Add many events with a single executemany INSERT; returns their IDs in order."""
+        owns_transaction = session is None
+        session = db.session if owns_transaction else session
+        try:
+            rows = [_event_row(event_data) for event_data in events_data]
+            if rows:
+                session.execute(_INSERT_EVENT, rows)
+            _complete(session, owns_transaction)
+            return [row['id'] for row in rows]
             
-            db.session.commit()
-            return event.id
+        except Exception as e:
+            _abort(session, owns_transaction)
+            raise Exception(f"Failed to add events: {str(e)}")
+    
+    @staticmethod
+    def bulk_load_csv(path, session=None):
+        """Load events from a CSV file; returns how many were added.
+        
+        The file has a header row naming the event columns (title, agenda, date,
+        time, importance, location, coordinator, recurrence, participants), with
+        participants as a JSON array. Empty fields are treated as missing, so
+        they get the same defaults as in add_event. On PostgreSQL with psycopg2
+        the rows go in through COPY, skipping per-row INSERT parsing; elsewhere
+        they are passed to add_events_bulk. Both store the same values.
+        """
+        owns_transaction = session is None
+        session = db.session if owns_transaction else session
+        try:
+            with open(path, newline='', encoding='utf-8') as csv_file:
+                events_data = _csv_events(csv_file)
+                bind = session.get_bind()
+                if bind.dialect.name == 'postgresql' and bind.dialect.driver == 'psycopg2':
+                    count = _copy_events(session, events_data)
+                else:
+                    count = len(EventService.add_events_bulk(events_data, session=session))
+            _complete(session, owns_transaction)
+            return count
             
         except Exception as e:
-            db.session.rollback()
-            raise Exception(f"Failed to add event: {str(e)}")
+            _abort(session, owns_transaction)
+            raise Exception(f"Failed to bulk load events: {str(e)}")
     
     @staticmethod
     def get_event(event_id):
         """Get an event by ID."""
         try:
-            event = Event.query.get(event_id)
+            event = db.session.execute(_STMT_GET, {'id': event_id}).scalar_one_or_none()
             if event:
                 return event.to_dict()
             return None
@@ -41,75 +193,142 @@ class EventService:
             raise Exception(f"Failed to get event: {str(e)}")
     
     @staticmethod
-    def get_all_events():
-        """Get all events."""
+    def get_event_title(event_id):
+        """Get just the title of an event, or None if there is no such event."""
         try:
-            events = Event.query.all()
-            return [event.to_dict() for event in events]
+            return db.session.scalar(_STMT_TITLE, {'id': event_id})
+        except Exception as e:
+            raise Exception(f"Failed to get event title: {str(e)}")
+    
+    @staticmethod
+    def event_exists(event_id):
+        """Check whether an event exists without loading it."""
+        try:
+            return db.session.scalar(_STMT_EXISTS, {'id': event_id})
+        except Exception as e:
+            raise Exception(f"Failed to check event: {str(e)}")
+    
+    @staticmethod
+    def get_all_events(limit=None, offset=None, updated_since=None):
+        """Get all events, or a most-recently-updated-first slice changed after updated_since."""
+        try:
+            stmt = select(Event)
+            if updated_since is not None:
+                stmt = stmt.where(Event.updated_at > updated_since)
+            if limit is not None or offset is not None or updated_since is not None:
+                stmt = stmt.order_by(Event.updated_at.desc(), Event.id).limit(limit).offset(offset)
+            return [event.to_dict() for event in db.session.scalars(stmt)]
+        except Exception as e:
+            raise Exception(f"Failed to get events: {str(e)}")
+    
+    @staticmethod
+    def iter_all_events(batch_size=1000):
+        """Yield all events as dicts, fetching rows from the database in batches."""
+        try:
+            # Server-side cursor where the driver has one, so only a batch is held at a time
+            stmt = select(Event).execution_options(stream_results=True, yield_per=batch_size)
+            for event in db.session.execute(stmt).scalars():
+                yield event.to_dict()
         except Exception as e:
             raise Exception(f"Failed to get events: {str(e)}")
     
     @staticmethod
-    def update_event(event_data):
-        """Update an existing event."""
+    def get_event_rows(limit=None, offset=None, updated_since=None):
+        """Get the list-view columns of events as plain dicts, without loading ORM objects."""
+        try:
+            stmt = select(
+                Event.id, Event.title, Event.date, Event.time, Event.importance,
+                Event.location, Event.coordinator, Event.updated_at
+            )
+            if updated_since is not None:
+                stmt = stmt.where(Event.updated_at > updated_since)
+            if limit is not None or offset is not None or updated_since is not None:
+                stmt = stmt.order_by(Event.updated_at.desc(), Event.id).limit(limit).offset(offset)
+            return [dict(row._mapping) for row in db.session.execute(stmt)]
+        except Exception as e:
+            raise Exception(f"Failed to get event rows: {str(e)}")
+    
+    @staticmethod
+    def get_events_page(offset, limit):
+        """Get one page of events ordered by date and time."""
+        try:
+            stmt = select(Event).order_by(Event.date, Event.time, Event.id).offset(offset).limit(limit)
+            return [event.to_dict() for event in db.session.scalars(stmt)]
+        except Exception as e:
+            raise Exception(f"Failed to get events page: {str(e)}")
+    
+    @staticmethod
+    def count_events():
+        """Count all events."""
+        try:
+            return db.session.scalar(_STMT_COUNT)
+        except Exception as e:
+            raise Exception(f"Failed to count events: {str(e)}")
+    
+    @staticmethod
+    def get_events_version():
+        """Get a version tag for the event list that changes whenever events are added, updated or deleted."""
+        try:
+            count, last_updated = db.session.execute(_STMT_VERSION).one()
+            return f"{count}-{last_updated.isoformat() if last_updated else ''}"
+        except Exception as e:
+            raise Exception(f"Failed to get events version: {str(e)}")
+    
+    @staticmethod
+    def update_event(event_data, session=None):
+        """Update an existing event; returns the updated event as a dict, or None if there is no such event."""
+        owns_transaction = session is None
+        session = db.session if owns_transaction else session
         try:
             event_id = event_data.get('id')
             if not event_id:
-                return False
-            
-            event = Event.query.get(event_id)
-            if not event:
-                return False
+                return None
             
-            # Update event fields
-            event.update_from_dict(event_data)
+            # One UPDATE, without loading the row first; participants are a column too
+            params = Event.update_values(event_data)
+            params['event_id'] = event_id
+            event = session.execute(_UPDATE_EVENT_RETURNING, params).mappings().one_or_none()
+            _forget_loaded(session, event_id)
+            if event is None:
+                # Nothing matched; still end the transaction the UPDATE began
+                _abort(session, owns_transaction)
+                return None
             
-            # Update participants if provided
-            if 'participants' in event_data:
-                # Remove existing participants
-                Participant.query.filter_by(event_id=event_id).delete()
-                
-                # Add new participants
-                for participant_name in event_data['participants']:
-                    if participant_name:  # Skip empty names
-                        participant = Participant(name=participant_name, event_id=event_id)
-                        db.session.add(participant)
-            
-            db.session.commit()
-            return True
+            _complete(session, owns_transaction)
+            return dict(event)
             
         except Exception as e:
-            db.session.rollback()
+            _abort(session, owns_transaction)
             raise Exception(f"Failed to update event: {str(e)}")
     
     @staticmethod
-    def delete_event(event_id):
+    def delete_event(event_id, session=None):
         """Delete an event by ID."""
+        owns_transaction = session is None
+        session = db.session if owns_transaction else session
         try:
-            event = Event.query.get(event_id)
-            if not event:
+            # One DELETE, without loading the row first; participants go with it
+            result = session.execute(_DELETE_EVENT_BY_ID, {'event_id': event_id})
+            _forget_loaded(session, event_id, deleted=True)
+            if result.rowcount == 0:
+                # Nothing matched; still end the transaction the DELETE began
+                _abort(session, owns_transaction)
                 return False
             
-            # Delete participants (cascade should handle this, but explicit is better)
-            Participant.query.filter_by(event_id=event_id).delete()
-            
-            # Delete event
-            db.session.delete(event)
-            db.session.commit()
+            _complete(session, owns_transaction)
             return True
             
         except Exception as e:
-            db.session.rollback()
+            _abort(session, owns_transaction)
             raise Exception(f"Failed to delete event: {str(e)}")
     
     @staticmethod
     def get_events_by_date_range(start_date, end_date):
         """Get events within a date range."""
         try:
-            events = Event.query.filter(
-                Event.date >= start_date,
-                Event.date <= end_date
-            ).all()
+            events = db.session.execute(
+                _STMT_DATE_RANGE, {'start_date': start_date, 'end_date': end_date}
+            ).scalars().all()
             return [event.to_dict() for event in events]
         except Exception as e:
             raise Exception(f"Failed to get events by date range: {str(e)}")
@@ -118,7 +337,7 @@ class EventService:
     def get_events_by_coordinator(coordinator):
         """Get events by coordinator."""
         try:
-            events = Event.query.filter(Event.coordinator.ilike(f'%{coordinator}%')).all()
+            events = db.session.execute(_STMT_BY_COORDINATOR, {'pattern': f'%{coordinator}%'}).scalars().all()
             return [event.to_dict() for event in events]
         except Exception as e:
             raise Exception(f"Failed to get events by coordinator: {str(e)}")
@@ -127,13 +346,7 @@ class EventService:
     def search_events(query):
         """Search events by title, agenda, or location."""
         try:
-            events = Event.query.filter(
-                db.or_(
-                    Event.title.ilike(f'%{query}%'),
-                    Event.agenda.ilike(f'%{query}%'),
-                    Event.location.ilike(f'%{query}%')
-                )
-            ).all()
+            events = db.session.execute(_STMT_SEARCH, {'pattern': f'%{query}%'}).scalars().all()
             return [event.to_dict() for event in events]
         except Exception as e:
             raise Exception(f"Failed to search events: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,74 @@
+"""
+Flask application and database setup shared by the SOAP/REST service and
+DB-only scripts such as init_db.py, without loading the web service stack.
+"""
+
+from flask import Flask
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+import os
+
+from .models import db
+
+app = Flask(__name__)
+
+# Database configuration
+basedir = os.path.abspath(os.path.dirname(__file__))
+app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get(
+    'DATABASE_URL',
+    f'sqlite:///{os.path.join(basedir, "..", "..", "event_scheduling.db")}'
+)
+app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+# Batch executemany INSERTs into multi-row VALUES statements, and keep
+# more compiled statements cached than the default 500
+engine_options = {
+    'insertmanyvalues_page_size': int(os.environ.get('APP_INSERTMANY_PAGE_SIZE', 1000)),
+    'query_cache_size': 1200
+}
+database_uri = app.config['SQLALCHEMY_DATABASE_URI']
+if database_uri.startswith(('postgresql://', 'postgresql+psycopg2://')):
+    # INSERTs already go through insertmanyvalues above; executemany UPDATEs
+    # and DELETEs are sent with psycopg2's execute_batch, 500 rows per round trip
+    engine_options.update(
+        executemany_mode='values_plus_batch',
+        executemany_batch_page_size=500
+    )
+elif database_uri in ('sqlite://', 'sqlite:///:memory:'):
+    # In-memory database (test runs): one connection shared by every thread,
+    # since each new connection would open a separate, empty database
+    engine_options.update(
+        poolclass=StaticPool,
+        connect_args={'check_same_thread': False}
+    )
+elif database_uri.startswith('sqlite:///'):
+    # File database: pooled connections are handed to whichever server thread checks them out
+    engine_options.update(
+        pool_size=8,
+        max_overflow=16,
+        connect_args={'check_same_thread': False}
+    )
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options
+
+# Initialize database
+db.init_app(app)
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """WAL lets readers run alongside a writer; NORMAL sync skips the fsync per commit.
+    
+    Each connection also gets a 64 MB page cache and reads the file through a
+    256 MB memory map instead of read() calls.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA cache_size=-64000')
+    cursor.execute('PRAGMA mmap_size=268435456')
+    cursor.close()
+
+with app.app_context():
+    if db.engine.dialect.name == 'sqlite':
+        event.listen(db.engine, 'connect', set_sqlite_pragmas)
+    
+    # Create tables
+    db.create_all()
\ No newline at end of file
@@ -1,50 +1,129 @@
-from flask import Flask, request, Response, jsonify
+from flask import request, Response
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
-from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
-import xml.etree.ElementTree as ET
-from datetime import date, time
-import re
+from flask_compress import Compress
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+from datetime import datetime
+from threading import Lock
+import gzip
 import os
-import json
+import sys
+import orjson
+from io import BytesIO
+from cachetools import TTLCache
 
-from .models import db
+from .db import app, db
 from .database_service import EventService as DatabaseEventService
 
-app = Flask(__name__)
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for request.get_json() and jsonify()."""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
+
+app.json = OrjsonProvider(app)
+
+def ojson(obj, status=200):
+    """Build a JSON response straight from orjson's bytes; dates/times serialize natively."""
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
+
 CORS(app)  # Enable CORS for cross-origin requests
+compress = Compress(app)  # zstd/br/gzip/deflate responses for clients that accept them
+# Flask-Compress appends ':<algorithm>' to the ETag of a compressed response
+COMPRESSED_ETAG_SUFFIXES = tuple(f':{algorithm}' for algorithm in compress.enabled_algorithms)
+
+# Page size used when a GetEventsPage request omits the limit
+DEFAULT_PAGE_SIZE = 50
 
-# Database configuration
-basedir = os.path.abspath(os.path.dirname(__file__))
-app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{os.path.join(basedir, "..", "..", "event_scheduling.db")}'
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Namespaces shared by request parsing and both response writers
+SOAP_ENV_NS = 'http://schemas.xmlsoap.org/soap/envelope/'
+WSDL_NS = 'http://eventscheduling.com/wsdl'
+SCHEMA_NS = 'http://eventscheduling.com/schemas'
 
-# Initialize database
-db.init_app(app)
+# Namespace prefixes declared on every SOAP response envelope
+SOAP_NSMAP = {
+    'soap': SOAP_ENV_NS,
+    'tns': WSDL_NS,
+    'sch': SCHEMA_NS,
+}
 
-# Create tables
-with app.app_context():
-    db.create_all()
+# Clark-notation ({namespace}name) tags for the envelope, built once
+ENVELOPE_TAG = f'{{{SOAP_ENV_NS}}}Envelope'
+BODY_TAG = f'{{{SOAP_ENV_NS}}}Body'
+FAULT_TAG = f'{{{SOAP_ENV_NS}}}Fault'
+RETURN_TAG = f'{{{WSDL_NS}}}return'
 
-def validate_importance(value):
-    """Validate importance field."""
-    if value not in ['low', 'medium', 'high']:
-        raise ValueError(f"Invalid importance value: {value}")
-    return value
+# Event child elements, in the order they are written to responses
+EVENT_FIELDS = ('id', 'title', 'agenda', 'date', 'time', 'importance', 'location', 'coordinator', 'recurrence')
+# Same fields for membership tests when parsing requests by local name
+EVENT_FIELD_SET = frozenset(EVENT_FIELDS)
 
-def validate_recurrence(value):
-    """Validate recurrence field."""
-    if value not in ['none', 'daily', 'weekly', 'monthly', 'annually']:
-        raise ValueError(f"Invalid recurrence value: {value}")
-    return value
+# Clark-notation tags for event elements, interned so lookups of parsed tags
+# can match on identity before comparing characters
+EVENT_TAG = sys.intern(f'{{{SCHEMA_NS}}}event')
+CLARK_FIELDS = tuple(sys.intern(f'{{{SCHEMA_NS}}}{field}') for field in EVENT_FIELDS)
+# (field, tag) pairs walked once per event by both writers, split where the
+# WSDL's EventType sequence puts participants (between coordinator and recurrence)
+FIELD_TAGS = tuple(zip(EVENT_FIELDS, CLARK_FIELDS))
+_PARTICIPANTS_POSITION = EVENT_FIELDS.index('recurrence')
+FIELD_TAGS_BEFORE_PARTICIPANTS = FIELD_TAGS[:_PARTICIPANTS_POSITION]
+FIELD_TAGS_AFTER_PARTICIPANTS = FIELD_TAGS[_PARTICIPANTS_POSITION:]
+PARTICIPANTS_TAG = sys.intern(f'{{{SCHEMA_NS}}}participants')
+PARTICIPANT_TAG = sys.intern(f'{{{SCHEMA_NS}}}participant')
+
+# Parsed tag -> local name for the event children, qualified and unqualified
+# (zeep), so the parse loop skips local_name() for the elements it reads
+_TAG_LOCAL_NAMES = {
+    tag: sys.intern(name)
+    for name in (*EVENT_FIELDS, 'participants', 'participant')
+    for tag in (sys.intern(f'{{{SCHEMA_NS}}}{name}'), sys.intern(name))
+}
+
+if HAS_LXML:
+    # No entity expansion or network access for untrusted request bodies; drop
+    # comments/PIs so every node seen while walking the tree is an element
+    XML_PARSER = ET.XMLParser(resolve_entities=False, no_network=True,
+                              remove_comments=True, remove_pis=True)
+else:
+    XML_PARSER = None
+
+# Allowed enum values for validation
+IMPORTANCE_VALUES = frozenset(('low', 'medium', 'high'))
+RECURRENCE_VALUES = frozenset(('none', 'daily', 'weekly', 'monthly', 'annually'))
+
+def validate_enum_fields(event_data):
+    """Validate the importance and recurrence fields, when present."""
+    if 'importance' in event_data and event_data['importance'] not in IMPORTANCE_VALUES:
+        raise ValueError(f"Invalid importance value: {event_data['importance']}")
+    if 'recurrence' in event_data and event_data['recurrence'] not in RECURRENCE_VALUES:
+        raise ValueError(f"Invalid recurrence value: {event_data['recurrence']}")
+
+def local_name(tag):
+    """Strip the {namespace} prefix from an element tag."""
+    return tag.rsplit('}', 1)[-1]
 
 def parse_soap_request(xml_data):
     """Parse SOAP request XML and extract event data."""
     try:
-        root = ET.fromstring(xml_data)
+        if isinstance(xml_data, str):
+            # lxml rejects str input that carries an encoding declaration
+            xml_data = xml_data.encode('utf-8')
+        root = ET.fromstring(xml_data, XML_PARSER)
         
-        # Find the Body element
-        body = root.find('.//{http://schemas.xmlsoap.org/soap/envelope/}Body')
+        # The Body is a direct child of the Envelope
+        body = root.find(BODY_TAG)
         if body is None:
             raise ValueError("SOAP Body not found")
         
@@ -54,215 +133,352 @@ def parse_soap_request(xml_data):
         event_id = None
         
         for child in body:
-            if child.tag.endswith('AddEvent'):
-                operation = 'AddEvent'
-                event_data = parse_event_from_xml(child)
-            elif child.tag.endswith('GetEvent'):
-                operation = 'GetEvent'
-                event_id = child.find('.//{http://eventscheduling.com/schemas}eventId')
-                if event_id is not None:
-                    event_id = event_id.text
-            elif child.tag.endswith('GetAllEvents'):
-                operation = 'GetAllEvents'
-            elif child.tag.endswith('UpdateEvent'):
-                operation = 'UpdateEvent'
-                event_data = parse_event_from_xml(child)
-            elif child.tag.endswith('DeleteEvent'):
-                operation = 'DeleteEvent'
-                event_id = child.find('.//{http://eventscheduling.com/schemas}eventId')
-                if event_id is not None:
-                    event_id = event_id.text
+            if not isinstance(child.tag, str):
+                continue  # unresolved entity reference (lxml)
+            # Accept both <AddEvent> and the WSDL's <AddEventRequest> element names
+            tag = local_name(child.tag)
+            if tag.endswith('Request'):
+                tag = tag[:-len('Request')]
+            parse_arguments = REQUEST_PARSERS.get(tag)
+            if parse_arguments is not None:
+                operation = tag
+                event_data, event_id = parse_arguments(child)
         
         return operation, event_data, event_id
     except ET.ParseError as e:
         raise ValueError(f"Invalid XML: {e}")
 
+def parse_event_id(element):
+    """Return the text of the first eventId element, or None."""
+    for elem in element.iter('*'):
+        if local_name(elem.tag) == 'eventId':
+            return elem.text
+    return None
+
 def parse_event_from_xml(element):
-    """Parse event data from XML element."""
+    """Parse event data from XML element in a single pass over its subtree."""
     event = {}
     
-    # Find event element
-    event_elem = element.find('.//{http://eventscheduling.com/schemas}eventData') or element.find('.//{http://eventscheduling.com/schemas}event')
-    if event_elem is None:
-        event_elem = element
-    
-    # Parse event fields
-    namespace = 'http://eventscheduling.com/schemas'
-    for field in ['id', 'title', 'agenda', 'date', 'time', 'importance', 'location', 'coordinator', 'recurrence']:
-        elem = event_elem.find(f'.//{{{namespace}}}{field}')
-        if elem is not None:
-            event[field] = elem.text
-    
-    # Parse participants
-    participants_elem = event_elem.find(f'.//{{{namespace}}}participants')
-    if participants_elem is not None:
-        participants = []
-        for participant in participants_elem.findall(f'.//{{{namespace}}}participant'):
-            if participant.text:
-                participants.append(participant.text)
-        event['participants'] = participants
+    # Match on local name so qualified and unqualified (zeep) children both work
+    tag_local_names = _TAG_LOCAL_NAMES
+    for elem in element.iter('*'):
+        tag = elem.tag
+        field = tag_local_names.get(tag) or local_name(tag)
+        if field in EVENT_FIELD_SET:
+            # First occurrence wins, as with find()
+            event.setdefault(field, elem.text)
+        elif field == 'participants':
+            event['participants'] = []
+        elif field == 'participant' and elem.text and 'participants' in event:
+            event['participants'].append(elem.text)
     
     return event
 
+def parse_page_from_xml(element):
+    """Parse offset/limit paging arguments from XML element."""
+    page = {'offset': 0, 'limit': DEFAULT_PAGE_SIZE}
+    # Match on local name: zeep sends these children unqualified
+    for elem in element.iter('*'):
+        field = local_name(elem.tag)
+        if field in page and elem.text:
+            page[field] = max(int(elem.text), 0)
+    return page
+
+# Operation name -> parser returning its (event_data, event_id) arguments
+REQUEST_PARSERS = {
+    'AddEvent': lambda element: (parse_event_from_xml(element), None),
+    'GetEvent': lambda element: (None, parse_event_id(element)),
+    'GetAllEvents': lambda element: (None, None),
+    'UpdateEvent': lambda element: (parse_event_from_xml(element), None),
+    'DeleteEvent': lambda element: (None, parse_event_id(element)),
+    # Paging arguments travel in event_data for this operation
+    'GetEventsPage': lambda element: (parse_page_from_xml(element), None),
+    'GetEventsCount': lambda element: (None, None),
+}
+
 def create_soap_response(operation, data=None, success=None, error=None):
     """Create SOAP response XML."""
-    envelope = ET.Element('{http://schemas.xmlsoap.org/soap/envelope/}Envelope')
-    envelope.set('xmlns:soap', 'http://schemas.xmlsoap.org/soap/envelope/')
-    envelope.set('xmlns:tns', 'http://eventscheduling.com/wsdl')
-    envelope.set('xmlns:sch', 'http://eventscheduling.com/schemas')
+    if HAS_LXML:
+        envelope = ET.Element(ENVELOPE_TAG, nsmap=SOAP_NSMAP)
+    else:
+        envelope = ET.Element(ENVELOPE_TAG)
+        for prefix, uri in SOAP_NSMAP.items():
+            envelope.set(f'xmlns:{prefix}', uri)
     
-    body = ET.SubElement(envelope, '{http://schemas.xmlsoap.org/soap/envelope/}Body')
+    body = ET.SubElement(envelope, BODY_TAG)
     
     if error:
-        fault = ET.SubElement(body, '{http://schemas.xmlsoap.org/soap/envelope/}Fault')
+        fault = ET.SubElement(body, FAULT_TAG)
         fault_code = ET.SubElement(fault, 'faultcode')
         fault_code.text = 'Server'
         fault_string = ET.SubElement(fault, 'faultstring')
         fault_string.text = str(error)
     else:
-        response_elem = ET.SubElement(body, f'{{http://eventscheduling.com/wsdl}}{operation}Response')
+        response_elem = ET.SubElement(body, f'{{{WSDL_NS}}}{operation}Response')
         
         if operation == 'AddEvent' and data:
-            result = ET.SubElement(response_elem, '{http://eventscheduling.com/wsdl}return')
+            result = ET.SubElement(response_elem, RETURN_TAG)
             result.text = data
         elif operation == 'GetEvent' and data:
             create_event_xml(response_elem, data)
-        elif operation == 'GetAllEvents' and data:
+        elif operation in ['GetAllEvents', 'GetEventsPage'] and data:
+            add_event_xml = create_event_xml  # bound once for the per-event loop
             for event in data:
-                create_event_xml(response_elem, event)
+                add_event_xml(response_elem, event)
+        elif operation == 'GetEventsCount':
+            result = ET.SubElement(response_elem, RETURN_TAG)
+            result.text = str(data)
         elif operation in ['UpdateEvent', 'DeleteEvent']:
-            result = ET.SubElement(response_elem, '{http://eventscheduling.com/wsdl}return')
+            result = ET.SubElement(response_elem, RETURN_TAG)
             result.text = 'true' if success else 'false'
     
     return ET.tostring(envelope, encoding='unicode')
 
 def create_event_xml(parent, event_data):
     """Create event XML element."""
-    event_elem = ET.SubElement(parent, '{http://eventscheduling.com/schemas}event')
+    sub_element = ET.SubElement  # local lookups in the per-field loop
+    get = event_data.get
+    event_elem = sub_element(parent, EVENT_TAG)
     
-    namespace = 'http://eventscheduling.com/schemas'
-    for field in ['id', 'title', 'agenda', 'date', 'time', 'importance', 'location', 'coordinator', 'recurrence']:
-        if field in event_data and event_data[field] is not None:
-            field_elem = ET.SubElement(event_elem, f'{{{namespace}}}{field}')
-            field_elem.text = str(event_data[field])
+    for field, tag in FIELD_TAGS_BEFORE_PARTICIPANTS:
+        value = get(field)
+        if value is not None:
+            sub_element(event_elem, tag).text = str(value)
     
-    if 'participants' in event_data and event_data['participants']:
-        participants_elem = ET.SubElement(event_elem, f'{{{namespace}}}participants')
-        for participant in event_data['participants']:
-            participant_elem = ET.SubElement(participants_elem, f'{{{namespace}}}participant')
-            participant_elem.text = participant
+    participants = get('participants')
+    if participants:
+        participants_elem = sub_element(event_elem, PARTICIPANTS_TAG)
+        for participant in participants:
+            sub_element(participants_elem, PARTICIPANT_TAG).text = participant
+    
+    for field, tag in FIELD_TAGS_AFTER_PARTICIPANTS:
+        value = get(field)
+        if value is not None:
+            sub_element(event_elem, tag).text = str(value)
+
+def write_event_xml(xf, event_data):
+    """Write one event to an lxml xmlfile writer; streaming twin of create_event_xml."""
+    with xf.element(EVENT_TAG):
+        get = event_data.get
+        for field, tag in FIELD_TAGS_BEFORE_PARTICIPANTS:
+            value = get(field)
+            if value is not None:
+                with xf.element(tag):
+                    xf.write(str(value))
+        
+        participants = get('participants')
+        if participants:
+            with xf.element(PARTICIPANTS_TAG):
+                for participant in participants:
+                    with xf.element(PARTICIPANT_TAG):
+                        xf.write(participant)
+        
+        for field, tag in FIELD_TAGS_AFTER_PARTICIPANTS:
+            value = get(field)
+            if value is not None:
+                with xf.element(tag):
+                    xf.write(str(value))
+
+def stream_events_response(operation, events):
+    """Serialize a list-of-events response incrementally without building the tree (lxml only)."""
+    buf = BytesIO()
+    with ET.xmlfile(buf, encoding='utf-8') as xf:
+        with xf.element(ENVELOPE_TAG, nsmap=SOAP_NSMAP):
+            with xf.element(BODY_TAG):
+                with xf.element(f'{{{WSDL_NS}}}{operation}Response'):
+                    for event in events:
+                        write_event_xml(xf, event)
+    return buf.getvalue()
 
 class EventService:
-    """Implementation of the Event Scheduling SOAP Service."""
+    """Implementation of the Event Scheduling SOAP Service.
+    
+    Methods run inside the calling request's app context.
+    """
     
     @staticmethod
     def add_event(event_data):
         """Add a new event to the store."""
         try:
-            # Validate fields
-            if 'importance' in event_data:
-                event_data['importance'] = validate_importance(event_data['importance'])
-            if 'recurrence' in event_data:
-                event_data['recurrence'] = validate_recurrence(event_data['recurrence'])
-            
-            with app.app_context():
-                event_id = DatabaseEventService.add_event(event_data)
-                return event_id
+            validate_enum_fields(event_data)
+            return DatabaseEventService.add_event(event_data)['id']
         except Exception as e:
             raise ValueError(f"Failed to add event: {e}")
 
     @staticmethod
     def get_event(event_id):
         """Retrieve a specific event by ID."""
-        with app.app_context():
-            return DatabaseEventService.get_event(event_id)
+        return DatabaseEventService.get_event(event_id)
 
     @staticmethod
     def get_all_events():
         """Retrieve all events."""
-        with app.app_context():
-            return DatabaseEventService.get_all_events()
+        return DatabaseEventService.get_all_events()
+
+    @staticmethod
+    def iter_all_events():
+        """Yield all events without loading them all at once."""
+        return DatabaseEventService.iter_all_events()
+
+    @staticmethod
+    def get_events_page(offset, limit):
+        """Retrieve one page of events."""
+        return DatabaseEventService.get_events_page(offset, limit)
+
+    @staticmethod
+    def count_events():
+        """Count all events."""
+        return DatabaseEventService.count_events()
 
     @staticmethod
     def update_event(event_data):
         """Update an existing event."""
         try:
-            # Validate fields
-            if 'importance' in event_data:
-                event_data['importance'] = validate_importance(event_data['importance'])
-            if 'recurrence' in event_data:
-                event_data['recurrence'] = validate_recurrence(event_data['recurrence'])
-            
-            with app.app_context():
-                return DatabaseEventService.update_event(event_data)
+            validate_enum_fields(event_data)
+            return DatabaseEventService.update_event(event_data) is not None
         except Exception as e:
             raise ValueError(f"Failed to update event: {e}")
 
     @staticmethod
     def delete_event(event_id):
         """Delete an event by ID."""
-        with app.app_context():
-            return DatabaseEventService.delete_event(event_id)
+        return DatabaseEventService.delete_event(event_id)
+
+def handle_get_event(event_data, event_id):
+    """Build the GetEvent response, or a fault when the ID is unknown."""
+    result = EventService.get_event(event_id)
+    if result:
+        return create_soap_response('GetEvent', data=result)
+    return create_soap_response('GetEvent', error="Event not found")
+
+def handle_get_all_events(event_data, event_id):
+    """Build the GetAllEvents response."""
+    if HAS_LXML:
+        # Stream rows from the DB straight into the serialized response
+        return stream_events_response('GetAllEvents', EventService.iter_all_events())
+    return create_soap_response('GetAllEvents', data=EventService.get_all_events())
+
+# Operation name -> handler taking the parsed (event_data, event_id) and returning response XML
+SOAP_HANDLERS = {
+    'AddEvent': lambda event_data, event_id: create_soap_response(
+        'AddEvent', data=EventService.add_event(event_data)),
+    'GetEvent': handle_get_event,
+    'GetAllEvents': handle_get_all_events,
+    'GetEventsPage': lambda event_data, event_id: create_soap_response(
+        'GetEventsPage', data=EventService.get_events_page(event_data['offset'], event_data['limit'])),
+    'GetEventsCount': lambda event_data, event_id: create_soap_response(
+        'GetEventsCount', data=EventService.count_events()),
+    'UpdateEvent': lambda event_data, event_id: create_soap_response(
+        'UpdateEvent', success=EventService.update_event(event_data)),
+    'DeleteEvent': lambda event_data, event_id: create_soap_response(
+        'DeleteEvent', success=EventService.delete_event(event_id)),
+}
+
+def handle_unknown(event_data, event_id):
+    """Fault for a Body without a recognised operation."""
+    return create_soap_response('Unknown', error="Unknown operation")
 
 @app.route('/soap', methods=['POST'])
 def soap_endpoint():
     """SOAP endpoint for event operations."""
     try:
-        xml_data = request.get_data(as_text=True)
+        xml_data = request.get_data()
         operation, event_data, event_id = parse_soap_request(xml_data)
-        
-        if operation == 'AddEvent':
-            result = EventService.add_event(event_data)
-            response_xml = create_soap_response('AddEvent', data=result)
-        elif operation == 'GetEvent':
-            result = EventService.get_event(event_id)
-            if result:
-                response_xml = create_soap_response('GetEvent', data=result)
-            else:
-                response_xml = create_soap_response('GetEvent', error="Event not found")
-        elif operation == 'GetAllEvents':
-            result = EventService.get_all_events()
-            response_xml = create_soap_response('GetAllEvents', data=result)
-        elif operation == 'UpdateEvent':
-            success = EventService.update_event(event_data)
-            response_xml = create_soap_response('UpdateEvent', success=success)
-        elif operation == 'DeleteEvent':
-            success = EventService.delete_event(event_id)
-            response_xml = create_soap_response('DeleteEvent', success=success)
-        else:
-            response_xml = create_soap_response('Unknown', error="Unknown operation")
-        
+        response_xml = SOAP_HANDLERS.get(operation, handle_unknown)(event_data, event_id)
         return Response(response_xml, content_type='text/xml')
     
     except Exception as e:
         error_response = create_soap_response('Error', error=str(e))
         return Response(error_response, content_type='text/xml', status=500)
 
+def load_wsdl():
+    """Read the WSDL document from the project's wsdl/ directory, or None if it is missing."""
+    # Get the directory of the current file and go up two levels to reach the project root
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(os.path.dirname(current_dir))
+    wsdl_path = os.path.join(project_root, 'wsdl', 'EventService.wsdl')
+    try:
+        with open(wsdl_path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+# Loaded (and gzipped) once at import so GET /soap never touches the disk or recompresses
+WSDL_BYTES = load_wsdl()
+WSDL_GZ = gzip.compress(WSDL_BYTES) if WSDL_BYTES is not None else None
+
 @app.route('/soap', methods=['GET'])
 def wsdl():
     """Serve WSDL file."""
-    import os
-    try:
-        # Get the directory of the current file and go up two levels to reach the project root
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(os.path.dirname(current_dir))
-        wsdl_path = os.path.join(project_root, 'wsdl', 'EventService.wsdl')
-        
-        with open(wsdl_path, 'r') as f:
-            wsdl_content = f.read()
-        return Response(wsdl_content, content_type='text/xml')
-    except FileNotFoundError:
+    if WSDL_BYTES is None:
         return "WSDL file not found", 404
+    if request.accept_encodings['gzip']:
+        # Already encoded, so Flask-Compress leaves it alone
+        response = Response(WSDL_GZ, content_type='text/xml')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(WSDL_BYTES, content_type='text/xml')
+    response.vary.add('Accept-Encoding')
+    return response
+
+# Serialized GET /api/events bodies keyed on (events version, query string); a
+# write changes the version, so stale entries are never hit and just age out
+EVENTS_RESPONSE_CACHE = TTLCache(maxsize=64, ttl=300)
+EVENTS_RESPONSE_CACHE_LOCK = Lock()
 
 # Additional REST API endpoints for testing and database interaction
 @app.route('/api/events', methods=['GET'])
 def api_get_all_events():
-    """REST API endpoint to get all events as JSON."""
+    """REST API endpoint to get all events as JSON.
+    
+    Optional query parameters: limit, offset, updated_since (ISO timestamp) to
+    fetch only events changed since a previous refresh, and fields=summary to
+    return only the list-view columns.
+    """
     try:
-        events = DatabaseEventService.get_all_events()
-        return jsonify({'events': events, 'status': 'success'})
+        try:
+            limit = request.args.get('limit', type=int)
+            offset = request.args.get('offset', type=int)
+            updated_since = request.args.get('updated_since')
+            if updated_since:
+                updated_since = datetime.fromisoformat(updated_since)
+        except ValueError as e:
+            return ojson({'error': f'Invalid query parameter: {str(e)}', 'status': 'error'}, 400)
+        
+        # Answer conditional GETs without rebuilding the list when nothing changed.
+        # Compressed responses carry the ETag with an ':<algorithm>' suffix and
+        # Flask-Compress leaves 304s alone, so match every form and echo back the one held
+        etag = DatabaseEventService.get_events_version()
+        held_etag = next(
+            (tag for tag in (etag, *(etag + suffix for suffix in COMPRESSED_ETAG_SUFFIXES))
+             if request.if_none_match.contains(tag)),
+            None
+        )
+        if held_etag:
+            response = Response(status=304)
+            response.set_etag(held_etag)
+            return response
+        
+        cache_key = (etag, request.query_string)
+        with EVENTS_RESPONSE_CACHE_LOCK:
+            body = EVENTS_RESPONSE_CACHE.get(cache_key)
+        if body is None:
+            if request.args.get('fields') == 'summary':
+                events = DatabaseEventService.get_event_rows(limit, offset, updated_since or None)
+            else:
+                events = DatabaseEventService.get_all_events(limit, offset, updated_since or None)
+            payload = {'events': events, 'status': 'success'}
+            if updated_since:
+                # Lets delta clients notice deletions they did not see
+                payload['total'] = DatabaseEventService.count_events()
+            body = orjson.dumps(payload)
+            with EVENTS_RESPONSE_CACHE_LOCK:
+                EVENTS_RESPONSE_CACHE[cache_key] = body
+        response = Response(body, mimetype='application/json')
+        response.set_etag(etag)
+        return response
     except Exception as e:
-        return jsonify({'error': str(e), 'status': 'error'}), 500
+        return ojson({'error': str(e), 'status': 'error'}, 500)
 
 @app.route('/api/events/<event_id>', methods=['GET'])
 def api_get_event(event_id):
@@ -270,11 +486,11 @@ def api_get_event(event_id):
     try:
         event = DatabaseEventService.get_event(event_id)
         if event:
-            return jsonify({'event': event, 'status': 'success'})
+            return ojson({'event': event, 'status': 'success'})
         else:
-            return jsonify({'error': 'Event not found', 'status': 'error'}), 404
+            return ojson({'error': 'Event not found', 'status': 'error'}, 404)
     except Exception as e:
-        return jsonify({'error': str(e), 'status': 'error'}), 500
+        return ojson({'error': str(e), 'status': 'error'}, 500)
 
 @app.route('/api/events', methods=['POST'])
 def api_create_event():
@@ -282,18 +498,19 @@ def api_create_event():
     try:
         event_data = request.get_json()
         if not event_data:
-            return jsonify({'error': 'No data provided', 'status': 'error'}), 400
+            return ojson({'error': 'No data provided', 'status': 'error'}, 400)
         
         # Validate required fields
         required_fields = ['title', 'date', 'time', 'coordinator']
         for field in required_fields:
             if field not in event_data:
-                return jsonify({'error': f'Missing required field: {field}', 'status': 'error'}), 400
+                return ojson({'error': f'Missing required field: {field}', 'status': 'error'}, 400)
         
-        event_id = DatabaseEventService.add_event(event_data)
-        return jsonify({'event_id': event_id, 'status': 'success'}), 201
+        # The stored event comes back from the INSERT, so clients need not fetch it again
+        event = DatabaseEventService.add_event(event_data)
+        return ojson({'event_id': event['id'], 'event': event, 'status': 'success'}, 201)
     except Exception as e:
-        return jsonify({'error': str(e), 'status': 'error'}), 500
+        return ojson({'error': str(e), 'status': 'error'}, 500)
 
 @app.route('/api/events/<event_id>', methods=['PUT'])
 def api_update_event(event_id):
@@ -301,16 +518,16 @@ def api_update_event(event_id):
     try:
         event_data = request.get_json()
         if not event_data:
-            return jsonify({'error': 'No data provided', 'status': 'error'}), 400
+            return ojson({'error': 'No data provided', 'status': 'error'}, 400)
         
         event_data['id'] = event_id
-        success = DatabaseEventService.update_event(event_data)
-        if success:
-            return jsonify({'status': 'success'})
+        event = DatabaseEventService.update_event(event_data)
+        if event:
+            return ojson({'event': event, 'status': 'success'})
         else:
-            return jsonify({'error': 'Event not found', 'status': 'error'}), 404
+            return ojson({'error': 'Event not found', 'status': 'error'}, 404)
     except Exception as e:
-        return jsonify({'error': str(e), 'status': 'error'}), 500
+        return ojson({'error': str(e), 'status': 'error'}, 500)
 
 @app.route('/api/events/<event_id>', methods=['DELETE'])
 def api_delete_event(event_id):
@@ -318,16 +535,16 @@ def api_delete_event(event_id):
     try:
         success = DatabaseEventService.delete_event(event_id)
         if success:
-            return jsonify({'status': 'success'})
+            return ojson({'status': 'success'})
         else:
-            return jsonify({'error': 'Event not found', 'status': 'error'}), 404
+            return ojson({'error': 'Event not found', 'status': 'error'}, 404)
     except Exception as e:
-        return jsonify({'error': str(e), 'status': 'error'}), 500
+        return ojson({'error': str(e), 'status': 'error'}, 500)
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
-    return jsonify({'status': 'healthy', 'database': 'connected'})
+    return ojson({'status': 'healthy', 'database': 'connected'})
 
 # Create WSGI app for compatibility
 wsgi_app = app
\ No newline at end of file
@@ -1,9 +1,12 @@
-import uuid
+from .ids import new_id
 
 # Simple in-memory storage dictionary
 # Key: Event ID (str), Value: Event data (dict or object)
 EVENT_STORE = {}
 
+# Sentinel for dict.pop so a delete needs a single lookup
+_MISSING = object()
+
 class EventStore:
     """Manages in-memory storage for events."""
     
@@ -13,13 +16,13 @@ class EventStore:
         # Ensure the event_data is a mutable dictionary for modification
         event_dict = dict(event_data)
         
-        # Generate a unique ID (as a string)
-        new_id = str(uuid.uuid4())
-        event_dict['id'] = new_id
+        # Generate a unique ID (32 hex characters, no dashes)
+        event_id = new_id()
+        event_dict['id'] = event_id
         
         # Store the event
-        EVENT_STORE[new_id] = event_dict
-        return new_id
+        EVENT_STORE[event_id] = event_dict
+        return event_id
 
     @staticmethod
     def get_event(event_id):
@@ -34,17 +37,14 @@ class EventStore:
     @staticmethod
     def update_event(event_data):
         """Updates an existing event's details."""
-        event_id = event_data.get('id')
-        if event_id in EVENT_STORE:
-            # Update all fields
-            EVENT_STORE[event_id].update(event_data)
-            return True
-        return False
+        existing = EVENT_STORE.get(event_data.get('id'))
+        if existing is None:
+            return False
+        # Update all fields
+        existing.update(event_data)
+        return True
 
     @staticmethod
     def delete_event(event_id):
         """Deletes an event by ID."""
-        if event_id in EVENT_STORE:
-            del EVENT_STORE[event_id]
-            return True
-        return False
\ No newline at end of file
+        return EVENT_STORE.pop(event_id, _MISSING) is not _MISSING
\ No newline at end of file
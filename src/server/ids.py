@@ -0,0 +1,31 @@
+"""
+Event ID generation. Random bytes are read from the OS in batches so most
+new IDs are cut from a buffer instead of costing an os.urandom() syscall.
+"""
+
+from threading import Lock
+import os
+import uuid
+
+# IDs produced per os.urandom() call
+ID_BATCH_SIZE = 256
+
+_pool = []
+_pool_lock = Lock()
+
+
+def _refill():
+    """Fill the pool with a batch of version 4 UUIDs as 32-character hex strings."""
+    raw = os.urandom(16 * ID_BATCH_SIZE)
+    _pool.extend(
+        uuid.UUID(bytes=raw[i:i + 16], version=4).hex
+        for i in range(0, len(raw), 16)
+    )
+
+
+def new_id():
+    """Return a new random event ID (uuid4 hex, no dashes)."""
+    with _pool_lock:
+        if not _pool:
+            _refill()
+        return _pool.pop()
\ No newline at end of file
@@ -1,14 +1,60 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import DDL, event
 from datetime import datetime, date, time
-import uuid
+
+from .ids import new_id
+
+
+def _participant_names(names):
+    """Copy a participants list, skipping empty names."""
+    return [name for name in names or [] if name]
+
+
+def _parse_date(value):
+    """Parse a YYYY-MM-DD string, using the C fromisoformat fast path first.
+    
+    fromisoformat also takes other ISO forms (20251010, 2025-W41-5), so only
+    the YYYY-MM-DD shape goes to it; everything else meets strptime's rules.
+    """
+    if len(value) == 10 and value[4] == '-' and value[7] == '-':
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+
+def _parse_time(value):
+    """Parse an HH:MM:SS string, using the C fromisoformat fast path first.
+    
+    Only the HH:MM:SS shape goes to fromisoformat, which would otherwise also
+    take offsets, fractions of a second and compact forms like 1000.
+    """
+    if len(value) == 8 and value[2] == ':' and value[5] == ':':
+        try:
+            return time.fromisoformat(value)
+        except ValueError:
+            pass
+    return datetime.strptime(value, '%H:%M:%S').time()
 
 db = SQLAlchemy()
 
 class Event(db.Model):
     """Event model for the database."""
     __tablename__ = 'events'
+    __table_args__ = (
+        # Trigram indexes so the unanchored ILIKE searches avoid full scans (PostgreSQL only)
+        db.Index('ix_events_title_trgm', 'title', postgresql_using='gin',
+                 postgresql_ops={'title': 'gin_trgm_ops'}).ddl_if(dialect='postgresql'),
+        db.Index('ix_events_agenda_trgm', 'agenda', postgresql_using='gin',
+                 postgresql_ops={'agenda': 'gin_trgm_ops'}).ddl_if(dialect='postgresql'),
+        db.Index('ix_events_location_trgm', 'location', postgresql_using='gin',
+                 postgresql_ops={'location': 'gin_trgm_ops'}).ddl_if(dialect='postgresql'),
+        db.Index('ix_events_coordinator_trgm', 'coordinator', postgresql_using='gin',
+                 postgresql_ops={'coordinator': 'gin_trgm_ops'}).ddl_if(dialect='postgresql'),
+    )
     
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = db.Column(db.String(36), primary_key=True, default=new_id)
     title = db.Column(db.String(200), nullable=False)
     agenda = db.Column(db.Text, nullable=True)
     date = db.Column(db.Date, nullable=False)
@@ -20,24 +66,28 @@ class Event(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
-    # Relationship with participants
-    participants = db.relationship('Participant', backref='event', lazy=True, cascade='all, delete-orphan')
+    # Participant names stored on the event row itself: one row per event, no join
+    participants = db.Column(db.JSON, nullable=False, default=list)
     
     def to_dict(self):
-        """Convert event to dictionary for JSON/XML serialization."""
+        """Convert event to dictionary for JSON/XML serialization.
+        
+        Dates and times stay as objects: orjson writes them as ISO strings and the
+        SOAP writers str() them, which gives the same ISO form.
+        """
         return {
             'id': self.id,
             'title': self.title,
             'agenda': self.agenda,
-            'date': self.date.isoformat() if self.date else None,
-            'time': self.time.strftime('%H:%M:%S') if self.time else None,
+            'date': self.date,
+            'time': self.time,
             'importance': self.importance,
             'location': self.location,
             'coordinator': self.coordinator,
             'recurrence': self.recurrence,
-            'participants': [p.name for p in self.participants],
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'participants': self.participants or [],
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
     
     @classmethod
@@ -50,14 +100,14 @@ class Event(db.Model):
         # Handle date conversion
         if data.get('date'):
             if isinstance(data['date'], str):
-                event.date = datetime.strptime(data['date'], '%Y-%m-%d').date()
+                event.date = _parse_date(data['date'])
             elif isinstance(data['date'], date):
                 event.date = data['date']
         
         # Handle time conversion
         if data.get('time'):
             if isinstance(data['time'], str):
-                event.time = datetime.strptime(data['time'], '%H:%M:%S').time()
+                event.time = _parse_time(data['time'])
             elif isinstance(data['time'], time):
                 event.time = data['time']
         
@@ -65,48 +115,45 @@ class Event(db.Model):
         event.location = data.get('location')
         event.coordinator = data.get('coordinator')
         event.recurrence = data.get('recurrence', 'none')
+        event.participants = _participant_names(data.get('participants'))
         
         return event
     
-    def update_from_dict(self, data):
-        """Update event from dictionary."""
-        if 'title' in data:
-            self.title = data['title']
-        if 'agenda' in data:
-            self.agenda = data['agenda']
+    @staticmethod
+    def update_values(data):
+        """Column values for the fields present in an update dictionary, ready for UPDATE ... SET."""
+        values = {}
+        for field in ('title', 'agenda', 'importance', 'location', 'coordinator', 'recurrence'):
+            if field in data:
+                values[field] = data[field]
         if 'date' in data:
             if isinstance(data['date'], str):
-                self.date = datetime.strptime(data['date'], '%Y-%m-%d').date()
+                values['date'] = _parse_date(data['date'])
             elif isinstance(data['date'], date):
-                self.date = data['date']
+                values['date'] = data['date']
         if 'time' in data:
             if isinstance(data['time'], str):
-                self.time = datetime.strptime(data['time'], '%H:%M:%S').time()
+                values['time'] = _parse_time(data['time'])
             elif isinstance(data['time'], time):
-                self.time = data['time']
-        if 'importance' in data:
-            self.importance = data['importance']
-        if 'location' in data:
-            self.location = data['location']
-        if 'coordinator' in data:
-            self.coordinator = data['coordinator']
-        if 'recurrence' in data:
-            self.recurrence = data['recurrence']
+                values['time'] = data['time']
+        if 'participants' in data:
+            values['participants'] = _participant_names(data['participants'])
         
-        self.updated_at = datetime.utcnow()
+        values['updated_at'] = datetime.utcnow()
+        return values
+    
+    def update_from_dict(self, data):
+        """Update event from dictionary."""
+        for field, value in Event.update_values(data).items():
+            setattr(self, field, value)
     
     def __repr__(self):
         return f'<Event {self.id}: {self.title}>'
 
 
-class Participant(db.Model):
-    """Participant model for events."""
-    __tablename__ = 'participants'
-    
-    id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(100), nullable=False)
-    event_id = db.Column(db.String(36), db.ForeignKey('events.id'), nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    
-    def __repr__(self):
-        return f'<Participant {self.name}>'
\ No newline at end of file
+# gin_trgm_ops comes from the pg_trgm extension, which must exist before the indexes
+event.listen(
+    Event.__table__,
+    'before_create',
+    DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm').execute_if(dialect='postgresql')
+)
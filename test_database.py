@@ -1,219 +1,298 @@
 #!/usr/bin/env python3
 """
-Test script to validate database operations for Event Scheduling System.
+Tests for the database operations and REST API of the Event Scheduling System.
+
+Run with pytest (fixtures live in conftest.py); independent tests can be
+spread over several processes with pytest-xdist: pytest -n 4 --dist=loadfile.
+The REST tests use Flask's test client unless --integration is given.
 """
 
+import csv
 import os
 import sys
-from datetime import datetime, date, time
-import requests
-import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 
-# Add the project root to the Python path
-project_root = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, project_root)
+import orjson
+import pytest
+from sqlalchemy import select
 
-from src.server.event_service import app, db
 from src.server.database_service import EventService
+from src.server.event_service import app
+from src.server.models import Event
+
+# Events inserted by the bulk-add test; raise it for a stress run
+BULK_EVENT_COUNT = int(os.environ.get('BULK_EVENT_COUNT', 200))
+
+# Events written to the CSV of the bulk-load test (COPY on PostgreSQL)
+BULK_LOAD_COUNT = int(os.environ.get('BULK_LOAD_COUNT', 1000))
+CSV_COLUMNS = ['title', 'agenda', 'date', 'time', 'importance', 'location',
+               'coordinator', 'recurrence', 'participants']
+
 
-def test_database_operations():
-    """Test database operations directly."""
-    print("=" * 50)
-    print("Testing Database Operations")
-    print("=" * 50)
+def generate_events(template, count, start=datetime(2025, 10, 10, 15, 30)):
+    """count copies of template, one hour apart from start.
     
+    Dates and times are passed as date/time objects, which from_dict takes
+    as they are instead of parsing strings.
+    """
+    step = timedelta(hours=1)
+    events = []
+    for i in range(count):
+        at = start + i * step
+        row = template.copy()
+        row['title'] = f"Bulk Test Event {i}"
+        row['date'] = at.date()
+        row['time'] = at.time()
+        events.append(row)
+    return events
+
+
+def test_add_event(app_context, event_data):
+    """Adding an event returns the stored row, ID included."""
+    event = EventService.add_event(event_data, session=app_context)
+    assert event['id']
+    assert event['title'] == 'Database Test Event'
+    assert event['participants'] == ['Tester 1', 'Tester 2']
+    assert event['created_at'] is not None
+
+
+def test_add_same_event_twice(app_context, event_data):
+    """Events may share a title, date and time."""
+    first = EventService.add_event(event_data, session=app_context)
+    second = EventService.add_event(event_data, session=app_context)
+    assert first['id'] != second['id']
+
+
+@pytest.mark.parametrize('field, value', [
+    ('date', '20251010'),
+    ('date', '2025-W41-5'),
+    ('time', '10:00:00+05:00'),
+    ('time', '10:00:00.123456'),
+    ('time', '1000'),
+])
+def test_add_event_rejects_other_iso_forms(app_context, event_data, field, value):
+    """Dates must be YYYY-MM-DD and times HH:MM:SS, not any ISO 8601 form."""
+    event_data[field] = value
+    with pytest.raises(Exception, match='does not match format|unconverted data remains'):
+        EventService.add_event(event_data, session=app_context)
+
+
+def test_add_events_bulk(app_context, event_data):
+    """Many events go in with one executemany INSERT."""
+    count_before = EventService.count_events()
+    bulk_rows = generate_events(event_data, BULK_EVENT_COUNT)
+    bulk_ids = EventService.add_events_bulk(bulk_rows, session=app_context)
+    assert len(bulk_ids) == BULK_EVENT_COUNT
+    assert EventService.count_events() - count_before == BULK_EVENT_COUNT
+
+
+@pytest.mark.bulk_load
+def write_events_csv(path, events):
+    """Write events in the CSV layout bulk_load_csv reads."""
+    with open(path, 'w', newline='', encoding='utf-8') as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=CSV_COLUMNS)
+        writer.writeheader()
+        for event in events:
+            row = dict(event)
+            if isinstance(row.get('participants'), (list, tuple)):
+                row['participants'] = orjson.dumps(row['participants']).decode()
+            writer.writerow(row)
+
+
+@pytest.mark.bulk_load
+def test_bulk_load_csv(app_context, event_data, tmp_path):
+    """Events are loaded from a CSV file."""
+    csv_path = tmp_path / 'events.csv'
+    write_events_csv(csv_path, generate_events(event_data, BULK_LOAD_COUNT))
+
+    count_before = EventService.count_events()
+    assert EventService.bulk_load_csv(csv_path, session=app_context) == BULK_LOAD_COUNT
+    assert EventService.count_events() - count_before == BULK_LOAD_COUNT
+
+
+@pytest.mark.bulk_load
+def test_bulk_load_csv_copy_matches_fallback(app_context, pg_session, event_data, tmp_path):
+    """COPY on PostgreSQL stores the same rows as the executemany fallback."""
+    csv_path = tmp_path / 'events.csv'
+    sparse_event = {'title': 'CSV Sparse Event', 'date': '2025-10-11', 'time': '09:00:00',
+                    'coordinator': 'CSV Tester'}
+    write_events_csv(csv_path, [dict(event_data, title='CSV Full Event'), sparse_event])
+
+    assert EventService.bulk_load_csv(csv_path, session=pg_session) == 2
+    assert EventService.bulk_load_csv(csv_path, session=app_context) == 2
+
+    columns = [getattr(Event, column) for column in CSV_COLUMNS]
+    stmt = (
+        select(*columns, Event.created_at.is_not(None), Event.updated_at.is_not(None))
+        .where(Event.title.in_(['CSV Full Event', 'CSV Sparse Event']))
+        .order_by(Event.title)
+    )
+    copied = pg_session.execute(stmt).all()
+    assert copied == app_context.execute(stmt).all()
+    # Empty fields take the model defaults rather than being stored as ''
+    sparse = copied[1]._mapping
+    assert sparse['agenda'] is None
+    assert (sparse['importance'], sparse['recurrence'], sparse['participants']) == ('medium', 'none', [])
+
+
+def test_get_event(app_context, created_event_id):
+    """A stored event comes back with its fields and participants."""
+    retrieved_event = EventService.get_event(created_event_id)
+    assert retrieved_event is not None
+    assert retrieved_event['title'] == 'Database Test Event'
+    assert retrieved_event['participants'] == ['Tester 1', 'Tester 2']
+
+
+def test_count_events(app_context, created_event_id):
+    """Counting runs in SQL instead of loading every event."""
+    event_count = EventService.count_events()
+    assert event_count >= 1
+    # Streamed in batches, so the comparison never holds every event at once
+    assert sum(1 for _ in EventService.iter_all_events()) == event_count
+
+
+def test_update_event(app_context, event_data, created_event_id):
+    """Updating changes the stored title and replaces the participants."""
+    event_data['id'] = created_event_id
+    event_data['title'] = 'Updated Database Test Event'
+    event_data['participants'] = ['Updated Tester 1', 'Updated Tester 2', 'New Tester']
+
+    # The updated row comes back from the UPDATE itself
+    updated_event = EventService.update_event(event_data, session=app_context)
+    assert updated_event['title'] == 'Updated Database Test Event'
+    assert updated_event['participants'] == ['Updated Tester 1', 'Updated Tester 2', 'New Tester']
+    assert EventService.get_event_title(created_event_id) == 'Updated Database Test Event'
+
+
+def test_update_event_refreshes_loaded_events(app_context, event_data, created_event_id):
+    """Queries in the same session see an update to an event it already holds."""
+    loaded = app_context.get(Event, created_event_id)
+
+    event_data['id'] = created_event_id
+    event_data['title'] = 'Updated Database Test Event'
+    EventService.update_event(event_data, session=app_context)
+
+    events = EventService.get_events_by_coordinator('Test User')
+    assert [event['title'] for event in events if event['id'] == created_event_id] == [
+        'Updated Database Test Event'
+    ]
+    assert loaded.title == 'Updated Database Test Event'
+
+
+def test_update_missing_event(app_context, event_data):
+    """Updating an unknown ID reports that nothing was updated."""
+    event_data['id'] = 'no-such-event'
+    assert EventService.update_event(event_data, session=app_context) is None
+
+
+def test_delete_event(app_context, created_event_id):
+    """Deleting removes the event, including from the session that held it."""
+    loaded = app_context.get(Event, created_event_id)
+    assert EventService.delete_event(created_event_id, session=app_context)
+    assert not EventService.event_exists(created_event_id)
+    assert loaded not in app_context
+
+
+def response_json(response, status=200):
+    """Check the status code and decode the body with orjson."""
+    assert response.status_code == status, response.text
+    return orjson.loads(response.content)
+
+
+@pytest.fixture
+def api_event_data():
+    """A fresh event payload for the REST tests."""
+    return {
+        'title': 'REST API Test Event',
+        'agenda': 'Testing REST API operations',
+        'date': '2025-10-12',
+        'time': '16:00:00',
+        'importance': 'medium',
+        'location': 'API Test Room',
+        'coordinator': 'API Tester',
+        'recurrence': 'weekly',
+        'participants': ['API Tester 1', 'API Tester 2']
+    }
+
+
+@pytest.fixture
+def api_event_id(api_session, api_base_url, api_event_data):
+    """ID of an event created through the API; deleted again afterwards."""
+    # Encoded once with orjson and sent with a JSON Content-Type
+    response = api_session.request('POST', f'{api_base_url}/events',
+                                   data=orjson.dumps(api_event_data), timeout=10)
+    event_id = response_json(response, 201)['event_id']
+    yield event_id
+    api_session.request('DELETE', f'{api_base_url}/events/{event_id}', timeout=10)
+
+
+def test_api_health(api_session, api_base_url):
+    """The health check reports a connected database."""
+    response = api_session.request('GET', f'{api_base_url}/health', timeout=5)
+    assert response_json(response)['status'] == 'healthy'
+
+
+def test_api_get_events(api_session, api_base_url, api_event_id):
+    """The list and the specific event can both be read."""
+    # The read-only requests are independent, so issue them concurrently over
+    # the shared session; (method, path, encoded payload, expected status)
+    read_ops = [
+        ('GET', '/events', None, 200),
+        ('GET', f'/events/{api_event_id}', None, 200),
+    ]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list_response, event_response = executor.map(
+            lambda op: api_session.request(op[0], api_base_url + op[1], data=op[2], timeout=10),
+            read_ops
+        )
+
+    events = response_json(list_response, read_ops[0][3])['events']
+    assert any(event['id'] == api_event_id for event in events)
+
+    event = response_json(event_response, read_ops[1][3])['event']
+    assert event['title'] == 'REST API Test Event'
+
+
+@pytest.mark.parametrize('algorithm', ['gzip', 'br', 'zstd'])
+def test_api_events_not_modified_for_compressed_etag(monkeypatch, algorithm):
+    """A compressed response's ETag in If-None-Match gets a 304 without the list being queried."""
     with app.app_context():
-        try:
-            # Test adding an event
-            print("\n1. Testing Add Event...")
-            event_data = {
-                'title': 'Database Test Event',
-                'agenda': 'Testing database operations',
-                'date': '2025-10-10',
-                'time': '15:30:00',
-                'importance': 'high',
-                'location': 'Test Room',
-                'coordinator': 'Test User',
-                'recurrence': 'none',
-                'participants': ['Tester 1', 'Tester 2']
-            }
-            
-            event_id = EventService.add_event(event_data)
-            print(f"✅ Event added successfully! ID: {event_id}")
-            
-            # Test getting the event
-            print("\n2. Testing Get Event...")
-            retrieved_event = EventService.get_event(event_id)
-            if retrieved_event:
-                print(f"✅ Event retrieved successfully!")
-                print(f"   Title: {retrieved_event['title']}")
-                print(f"   Participants: {retrieved_event['participants']}")
-            else:
-                print("❌ Failed to retrieve event")
-                return False
-            
-            # Test getting all events
-            print("\n3. Testing Get All Events...")
-            all_events = EventService.get_all_events()
-            print(f"✅ Retrieved {len(all_events)} events")
-            
-            # Test updating the event
-            print("\n4. Testing Update Event...")
-            event_data['id'] = event_id
-            event_data['title'] = 'Updated Database Test Event'
-            event_data['participants'] = ['Updated Tester 1', 'Updated Tester 2', 'New Tester']
-            
-            success = EventService.update_event(event_data)
-            if success:
-                print("✅ Event updated successfully!")
-                
-                # Verify update
-                updated_event = EventService.get_event(event_id)
-                if updated_event and updated_event['title'] == 'Updated Database Test Event':
-                    print("✅ Update verified!")
-                    print(f"   New participants: {updated_event['participants']}")
-                else:
-                    print("❌ Update verification failed")
-            else:
-                print("❌ Failed to update event")
-            
-            # Test deleting the event
-            print("\n5. Testing Delete Event...")
-            success = EventService.delete_event(event_id)
-            if success:
-                print("✅ Event deleted successfully!")
-                
-                # Verify deletion
-                deleted_event = EventService.get_event(event_id)
-                if not deleted_event:
-                    print("✅ Deletion verified!")
-                else:
-                    print("❌ Deletion verification failed")
-            else:
-                print("❌ Failed to delete event")
-            
-            return True
-            
-        except Exception as e:
-            print(f"❌ Database test failed: {str(e)}")
-            return False
-
-def test_rest_api():
-    """Test REST API endpoints."""
-    print("\n" + "=" * 50)
-    print("Testing REST API Endpoints")
-    print("=" * 50)
-    
-    base_url = 'http://localhost:8000/api'
-    
-    try:
-        # Test health check
-        print("\n1. Testing Health Check...")
-        response = requests.get(f'{base_url}/health', timeout=5)
-        if response.status_code == 200:
-            print("✅ Health check passed!")
-            print(f"   Response: {response.json()}")
-        else:
-            print(f"❌ Health check failed with status {response.status_code}")
-            return False
-        
-        # Test creating an event
-        print("\n2. Testing Create Event API...")
-        event_data = {
-            'title': 'REST API Test Event',
-            'agenda': 'Testing REST API operations',
-            'date': '2025-10-12',
-            'time': '16:00:00',
-            'importance': 'medium',
-            'location': 'API Test Room',
-            'coordinator': 'API Tester',
-            'recurrence': 'weekly',
-            'participants': ['API Tester 1', 'API Tester 2']
-        }
-        
-        response = requests.post(f'{base_url}/events', json=event_data, timeout=10)
-        if response.status_code == 201:
-            result = response.json()
-            event_id = result['event_id']
-            print(f"✅ Event created via API! ID: {event_id}")
-        else:
-            print(f"❌ Failed to create event via API: {response.status_code}")
-            print(f"   Response: {response.text}")
-            return False
-        
-        # Test getting all events
-        print("\n3. Testing Get All Events API...")
-        response = requests.get(f'{base_url}/events', timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            events = data.get('events', [])
-            print(f"✅ Retrieved {len(events)} events via API")
-        else:
-            print(f"❌ Failed to get events via API: {response.status_code}")
-        
-        # Test getting specific event
-        print("\n4. Testing Get Specific Event API...")
-        response = requests.get(f'{base_url}/events/{event_id}', timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            event = data.get('event')
-            print("✅ Retrieved specific event via API")
-            print(f"   Title: {event['title']}")
-        else:
-            print(f"❌ Failed to get specific event via API: {response.status_code}")
-        
-        # Test updating event
-        print("\n5. Testing Update Event API...")
-        update_data = {
-            'title': 'Updated REST API Test Event',
-            'participants': ['Updated API Tester 1', 'Updated API Tester 2', 'New API Tester']
-        }
-        
-        response = requests.put(f'{base_url}/events/{event_id}', json=update_data, timeout=10)
-        if response.status_code == 200:
-            print("✅ Event updated via API!")
-        else:
-            print(f"❌ Failed to update event via API: {response.status_code}")
-        
-        # Test deleting event
-        print("\n6. Testing Delete Event API...")
-        response = requests.delete(f'{base_url}/events/{event_id}', timeout=10)
-        if response.status_code == 200:
-            print("✅ Event deleted via API!")
-        else:
-            print(f"❌ Failed to delete event via API: {response.status_code}")
-        
-        return True
-        
-    except requests.exceptions.RequestException as e:
-        print(f"❌ REST API test failed: Connection error - {str(e)}")
-        print("   Make sure the server is running on http://localhost:8000")
-        return False
-    except Exception as e:
-        print(f"❌ REST API test failed: {str(e)}")
-        return False
-
-def main():
-    """Run all tests."""
-    print("Event Scheduling System - Database Integration Test")
-    print("Make sure the server is running before running REST API tests!")
-    
-    # Test database operations
-    db_success = test_database_operations()
-    
-    # Test REST API
-    api_success = test_rest_api()
-    
-    print("\n" + "=" * 50)
-    print("Test Results Summary")
-    print("=" * 50)
-    print(f"Database Operations: {'✅ PASSED' if db_success else '❌ FAILED'}")
-    print(f"REST API Endpoints:  {'✅ PASSED' if api_success else '❌ FAILED'}")
-    
-    if db_success and api_success:
-        print("\n🎉 All tests passed! Database integration is working correctly!")
-    else:
-        print("\n⚠️  Some tests failed. Check the output above for details.")
+        etag = EventService.get_events_version()
+
+    def list_query(*args, **kwargs):
+        raise AssertionError('event list queried for an unchanged ETag')
+    monkeypatch.setattr(EventService, 'get_all_events', staticmethod(list_query))
+    monkeypatch.setattr(EventService, 'get_event_rows', staticmethod(list_query))
+
+    response = app.test_client().get('/api/events', headers={
+        'Accept-Encoding': algorithm,
+        'If-None-Match': f'"{etag}:{algorithm}"'
+    })
+    assert response.status_code == 304
+    assert response.headers['ETag'] == f'"{etag}:{algorithm}"'
+
+
+def test_api_update_event(api_session, api_base_url, api_event_id):
+    """PUT changes the event."""
+    update_data = {
+        'title': 'Updated REST API Test Event',
+        'participants': ['Updated API Tester 1', 'Updated API Tester 2', 'New API Tester']
+    }
+    response = api_session.request('PUT', f'{api_base_url}/events/{api_event_id}',
+                                   data=orjson.dumps(update_data), timeout=10)
+    event = response_json(response)['event']
+    assert event['title'] == 'Updated REST API Test Event'
+    assert event['participants'] == ['Updated API Tester 1', 'Updated API Tester 2', 'New API Tester']
+
+
+def test_api_delete_event(api_session, api_base_url, api_event_id):
+    """DELETE removes the event."""
+    response = api_session.request('DELETE', f'{api_base_url}/events/{api_event_id}', timeout=10)
+    assert response.status_code == 200
+    response = api_session.request('GET', f'{api_base_url}/events/{api_event_id}', timeout=10)
+    assert response.status_code == 404
+
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    sys.exit(pytest.main([__file__, '-v']))
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""
+SOAP tests for the Event Scheduling System. Responses are parsed by zeep
+against the served WSDL, the same way the GUI client reads them.
+"""
+
+from urllib.parse import urlparse
+
+import pytest
+import requests
+from zeep import Client
+from zeep.transports import Transport
+
+from src.server.event_service import app
+
+# WSDL address the GUI client uses; requests go to the app in-process
+SERVICE_URL = 'http://localhost:8000/soap?wsdl'
+
+
+class AppTransport(Transport):
+    """zeep transport that sends WSDL loads and SOAP posts through Flask's test client."""
+
+    def __init__(self, client):
+        super().__init__()
+        self.client = client
+
+    def load(self, url):
+        parts = urlparse(url)
+        return self.client.get(parts.path, query_string=parts.query).get_data()
+
+    def post(self, address, message, headers):
+        response = self.client.post(urlparse(address).path, data=message, headers=headers)
+        result = requests.Response()
+        result.status_code = response.status_code
+        result.headers.update(response.headers)
+        result._content = response.get_data()
+        result.encoding = 'utf-8'
+        return result
+
+
+@pytest.fixture(scope='module')
+def soap_service():
+    """zeep service proxy for the app's SOAP endpoint."""
+    return Client(SERVICE_URL, transport=AppTransport(app.test_client())).service
+
+
+@pytest.fixture
+def soap_event_id(soap_service):
+    """ID of an event with participants added over SOAP; deleted again afterwards."""
+    event_id = soap_service.AddEvent({
+        'title': 'SOAP Test Event',
+        'agenda': 'Testing SOAP responses',
+        'date': '2025-10-11',
+        'time': '11:00:00',
+        'importance': 'low',
+        'location': 'SOAP Room',
+        'coordinator': 'SOAP Tester',
+        'participants': {'participant': ['SOAP Tester 1', 'SOAP Tester 2']},
+        'recurrence': 'daily'
+    })
+    yield event_id
+    soap_service.DeleteEvent(event_id)
+
+
+def test_soap_get_event(soap_service, soap_event_id):
+    """GetEvent parses against EventType, participants and recurrence included."""
+    event = soap_service.GetEvent(soap_event_id)
+    assert event.title == 'SOAP Test Event'
+    assert event.participants.participant == ['SOAP Tester 1', 'SOAP Tester 2']
+    assert event.recurrence == 'daily'
+
+
+def test_soap_get_all_events(soap_service, soap_event_id):
+    """GetAllEvents parses against EventType."""
+    events = soap_service.GetAllEvents()
+    assert any(event.id == soap_event_id for event in events)
+
+
+def test_soap_get_events_page(soap_service, soap_event_id):
+    """GetEventsPage parses against EventType."""
+    count = soap_service.GetEventsCount()
+    events = soap_service.GetEventsPage(offset=0, limit=count)
+    assert any(event.id == soap_event_id for event in events)
\ No newline at end of file